@@ -48,6 +48,10 @@ async def on_ready():
     # Slash commands are synced manually via `!jw sync` to avoid
     # hitting Discord rate limits on every restart.
 
+    # Eras are near-static; fetch them once now so `eras` and era
+    # autocomplete start warm.
+    helpers.spawn(helpers.prime_eras_cache())
+
     # Start linked roles web server (if configured).
     await _start_linked_roles_server()
 
@@ -61,7 +65,7 @@ async def on_command_error(ctx: commands.Context, error: commands.CommandError)
     if isinstance(error, _commands_mod.CommandNotFound):
         try:
             if ctx.message:
-                asyncio.create_task(helpers.delete_later(ctx.message, 5))
+                helpers.schedule_message_deletion(ctx.message, 5)
         except Exception:
             pass
         content = f"Command `{ctx.message.content}` is not found."
@@ -82,7 +86,7 @@ async def _delete_user_command(ctx: commands.Context) -> None:
         delay = 5
         if cmd and getattr(cmd, "name", None) == "stop":
             delay = 1
-        asyncio.create_task(helpers.delete_later(msg, delay))
+        helpers.schedule_message_deletion(msg, delay)
     except Exception:
         return
 
@@ -121,7 +125,7 @@ async def _start_linked_roles_server() -> None:
 
     config = uvicorn.Config(lr_app, host="0.0.0.0", port=LINKED_ROLES_PORT, log_level="warning")
     server = uvicorn.Server(config)
-    asyncio.create_task(server.serve())
+    helpers.spawn(server.serve())
     print(f"[linked_roles] Web server started on port {LINKED_ROLES_PORT}.")
 
 
@@ -3,7 +3,7 @@
 import aiohttp
 import time
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Union
+from typing import Any, BinaryIO, Dict, List, Optional, Union
 from urllib.parse import quote
 
 from models import Song, Artist, Album, Era, FileInfo, DirectoryInfo, Stats
@@ -18,9 +18,15 @@ class JuiceWRLDAPI:
     each other.
     """
 
-    def __init__(self, base_url: str = "https://juicewrldapi.com", timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str = "https://juicewrldapi.com",
+        timeout: int = 30,
+        pool_limit: int = 32,
+    ):
         self.base_url = base_url.rstrip('/')
         self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._pool_limit = pool_limit
         self._session: Optional[aiohttp.ClientSession] = None
         self.rate_limit_remaining = 100
         self.rate_limit_reset = time.time() + 60
@@ -34,6 +40,7 @@ class JuiceWRLDAPI:
                     'Accept': 'application/json',
                 },
                 timeout=self._timeout,
+                connector=aiohttp.TCPConnector(limit=self._pool_limit, keepalive_timeout=30),
             )
         return self._session
 
@@ -306,12 +313,17 @@ class JuiceWRLDAPI:
         except Exception as e:
             return {'error': f'Unexpected request failure: {e}', 'song_id': song_id, 'status': 'request_error'}
 
-    async def stream_audio_file(self, file_path: str) -> Dict[str, Any]:
-        """Check if an audio file exists and return streaming info."""
+    async def stream_audio_file(self, file_path: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Check if an audio file exists and return streaming info.
+
+        *timeout* (seconds) bounds the range probe; by default the session
+        timeout applies.
+        """
         try:
             session = await self._ensure_session()
             stream_url = f"{self.base_url}/juicewrld/files/download/?path={quote(file_path)}"
-            async with session.get(stream_url, headers={'Range': 'bytes=0-0'}) as resp:
+            extra: Dict[str, Any] = {'timeout': aiohttp.ClientTimeout(total=timeout)} if timeout else {}
+            async with session.get(stream_url, headers={'Range': 'bytes=0-0'}, **extra) as resp:
                 if resp.status in (200, 206):
                     return {
                         'status': 'success',
@@ -431,6 +443,28 @@ class JuiceWRLDAPI:
         except aiohttp.ClientError as e:
             raise JuiceWRLDAPIError(f"ZIP creation failed: {e}")
 
+    async def create_zip_into(self, file_paths: List[str], fileobj: BinaryIO, chunk_size: int = 65536) -> int:
+        """Stream a ZIP of *file_paths* into *fileobj* chunk by chunk.
+
+        Unlike :meth:`create_zip` the archive is never held in memory as a
+        single ``bytes`` object.  Returns the number of bytes written.
+        """
+        session = await self._ensure_session()
+        written = 0
+        try:
+            async with session.post(
+                f"{self.base_url}/juicewrld/files/zip-selection/",
+                json={'paths': file_paths},
+            ) as resp:
+                if resp.status >= 400:
+                    raise JuiceWRLDAPIError(f"ZIP creation failed: HTTP {resp.status}")
+                async for chunk in resp.content.iter_chunked(chunk_size):
+                    fileobj.write(chunk)
+                    written += len(chunk)
+        except aiohttp.ClientError as e:
+            raise JuiceWRLDAPIError(f"ZIP creation failed: {e}")
+        return written
+
     async def start_zip_job(self, file_paths: List[str]) -> str:
         data = await self._post('/juicewrld/start-zip-job/', {'paths': file_paths})
         return data.get('job_id')
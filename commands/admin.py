@@ -14,6 +14,7 @@ from discord.ext import commands, tasks
 from constants import (
     BOT_VERSION,
     BOT_BUILD_DATE,
+    DEV_GUILD_IDS,
     DISCORD_TOKEN,
 )
 from exceptions import JuiceWRLDAPIError
@@ -22,11 +23,112 @@ import state
 from views.sotd import SongOfTheDayView
 
 
+# ── Static embeds ────────────────────────────────────────────────────
+# Help and version text never change at runtime, so build them once.
+
+def _build_help_embed() -> discord.Embed:
+    embed = discord.Embed(title="Juice WRLD Bot Help", colour=discord.Colour.purple())
+
+    core_lines = [
+        "`!jw play <song_id>` — Play a song by ID in your voice channel.",
+        "`!jw search <query>` — Search songs with interactive Play/Playlist/Info buttons.",
+        "`!jw song <song_id>` — View song details with Play/Playlist/Info buttons.",
+        "`!jw radio` — Start radio mode (random songs until `!jw stop`).",
+        "`!jw stop` — Stop playback and turn off radio mode.",
+        "`!jw join` — Make the bot join your voice channel.",
+        "`!jw leave` — Disconnect the bot from voice.",
+        "`!jw link` — Get a link to connect your Discord account for linked roles.",
+        "`!jw ping` — Check if the bot is alive.",
+    ]
+    embed.add_field(name="Core Commands", value="\n".join(core_lines), inline=False)
+
+    comp_lines = [
+        "`!jw comp <name>` — Search Compilation and play the best match.",
+        "`!jw stusesh <name>` — Search Studio Sessions only.",
+        "`!jw og <name>` — Search Original Files only.",
+        "`!jw seshedits <name>` — Search Session Edits only.",
+        "`!jw stems <name>` — Search Stem Edits only.",
+        "`!jw playsearch <name>` — Search all comp files.",
+        "`!jw playfile <path>` — Play directly from a comp file path.",
+    ]
+    embed.add_field(name="Comp Playback", value="\n".join(comp_lines), inline=False)
+
+    playlist_lines = [
+        "`!jw pl` — List your playlists (also `!jw playlist` or `!jw playlists`).",
+        "`!jw pl show <name>` — Show full contents of a playlist.",
+        "`!jw pl play <name>` — Queue/play all tracks in a playlist.",
+        "`!jw pl add <name> <song_id>` — Add a song (by ID) to a playlist.",
+        "`!jw pl create <name>` — Create a new empty playlist.",
+        "`!jw pl delete <name>` — Delete a playlist.",
+        "`!jw pl rename <old> <new>` — Rename a playlist.",
+        "`!jw pl remove <name> <index>` — Remove a track by index.",
+        "`!jw pl share <name>` — Share a playlist publicly in the channel.",
+        "`!jw pl import @user <name>` — Copy another user's playlist.",
+    ]
+    embed.add_field(name="Playlists", value="\n".join(playlist_lines), inline=False)
+
+    browse_lines = [
+        "`!jw eras` — List all Juice WRLD musical eras.",
+        "`!jw era <name>` — Browse songs from a specific era.",
+        "`!jw similar` — Find songs similar to the currently playing track.",
+        "`!jw stats` — View your personal listening stats.",
+        "`!jw history` — Show the last 10 songs played in this server.",
+    ]
+    embed.add_field(name="Browse & Discover", value="\n".join(browse_lines), inline=False)
+
+    admin_lines = [
+        "`!jw sotd [#channel]` — Set/view the Song of the Day channel.",
+        "`!jw sotdtime [HH:MM]` — Set/view the SOTD announcement time (PT).",
+        "`!jw emoji list|upload|delete` — Manage application emojis.",
+        "`!jw sync` — Force-sync slash commands to Discord.",
+        "`!jw ver` — Show bot version and recent updates.",
+    ]
+    embed.add_field(name="Admin", value="\n".join(admin_lines), inline=False)
+
+    slash_lines = [
+        "All commands are also available as `/jw <command>`.",
+        "`/jw sotd` — View the current Song of the Day.",
+        "Type `/jw` in chat to see the full slash command list.",
+    ]
+    embed.add_field(name="Slash Commands", value="\n".join(slash_lines), inline=False)
+
+    embed.set_footer(text="Prefix: !jw  •  Aliases: !jw pl = !jw playlist = !jw playlists")
+    return embed
+
+
+def _build_version_embed() -> discord.Embed:
+    embed = discord.Embed(
+        title="JuiceAPI Bot Version",
+        description=f"**Version:** {BOT_VERSION}\n**Build Date:** {BOT_BUILD_DATE}",
+        colour=discord.Colour.green(),
+    )
+    embed.add_field(
+        name="Recent Updates (v3.5.3)",
+        value=(
+            "• 🔍 Genius Lyrics Search — Improved matching for songs with alternate titles\n"
+            "• ℹ️ Info Button Fix — Fixed info button silently failing in `/jw search`\n"
+            "• 🔗 Linked Roles — Use `!jw link` to connect your Discord account\n"
+            "• 📊 Stats Tracking — Track plays, listen hours, and unique songs\n"
+            "• 🎵 Interactive song selection, lyrics, and snippets\n"
+            "• 🎤 Genius API fallback for lyrics"
+        ),
+        inline=False,
+    )
+    embed.set_footer(text="Use !jw help for all commands")
+    return embed
+
+
+_HELP_EMBED = _build_help_embed()
+_VERSION_EMBED = _build_version_embed()
+
+
 class AdminCog(commands.Cog):
     """Admin, utility, and SOTD commands."""
 
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
+        # SOTD webhook per channel ID, so daily posts skip the webhooks() lookup.
+        self._sotd_webhooks: Dict[int, discord.Webhook] = {}
         self._song_of_the_day_task.start()
 
         # Context menus must be registered manually in Cogs.
@@ -115,6 +217,9 @@ class AdminCog(commands.Cog):
 
         view = SongOfTheDayView(song_data=song_data, queue_fn=playback._queue_or_play_now, stream_fn=playback._get_fresh_stream_url)
 
+        # Post to every configured channel concurrently; the embed and view
+        # are serialized per send, so sharing them is safe.
+        posts = []
         for guild_id_str, channel_id in list(state.sotd_config.items()):
             guild_obj = self.bot.get_guild(int(guild_id_str))
             if not guild_obj:
@@ -122,41 +227,69 @@ class AdminCog(commands.Cog):
             chan = guild_obj.get_channel(channel_id)
             if not isinstance(chan, discord.TextChannel):
                 continue
+            posts.append(self._post_sotd(chan, embed=embed, view=view, image_url=image_url))
+        await asyncio.gather(*posts, return_exceptions=True)
+
+    async def _post_sotd(
+        self,
+        chan: discord.TextChannel,
+        *,
+        embed: discord.Embed,
+        view: discord.ui.View,
+        image_url: Optional[str],
+    ) -> None:
+        """Post the SOTD to one channel, preferring the "Juice WRLD Radio" webhook.
+
+        A webhook that has been deleted or lost its permissions is dropped
+        from the cache and looked up once more; if that still fails the
+        post falls back to a normal bot message.
+        """
+        send_kwargs = dict(
+            embed=embed,
+            view=view,
+            username="Juice WRLD Radio",
+            avatar_url=image_url if image_url else None,
+        )
+        guild_name = chan.guild.name
+        for attempt in range(2):
+            webhook = await self._get_or_create_sotd_webhook(chan)
+            if webhook is None:
+                break
             try:
-                # Try webhook-based posting for a custom "Juice WRLD Radio" identity.
-                webhook = await self._get_or_create_sotd_webhook(chan)
-                if webhook:
-                    await webhook.send(
-                        embed=embed,
-                        view=view,
-                        username="Juice WRLD Radio",
-                        avatar_url=image_url if image_url else None,
-                    )
-                    print(f"[sotd] Posted via webhook to #{chan.name} in {guild_obj.name}")
-                else:
-                    await chan.send(embed=embed, view=view)
-                    print(f"[sotd] Posted to #{chan.name} in {guild_obj.name}")
+                await webhook.send(**send_kwargs)
+                print(f"[sotd] Posted via webhook to #{chan.name} in {guild_name}")
+                return
+            except (discord.NotFound, discord.Forbidden) as exc:
+                self._sotd_webhooks.pop(chan.id, None)
+                print(f"[sotd] Webhook gone for #{chan.name} (attempt {attempt + 1}): {exc}", file=sys.stderr)
             except Exception as exc:
-                # Fall back to normal bot message on any failure.
                 print(f"[sotd] Webhook failed for #{chan.name}: {exc}", file=sys.stderr)
-                try:
-                    await chan.send(embed=embed, view=view)
-                    print(f"[sotd] Fallback post to #{chan.name} in {guild_obj.name}")
-                except Exception as exc2:
-                    print(f"[sotd] Failed to post to #{chan.name}: {exc2}", file=sys.stderr)
-                    continue
+                break
+
+        try:
+            await chan.send(embed=embed, view=view)
+            print(f"[sotd] Posted to #{chan.name} in {guild_name}")
+        except Exception as exc:
+            print(f"[sotd] Failed to post to #{chan.name}: {exc}", file=sys.stderr)
 
 
     async def _get_or_create_sotd_webhook(self, channel: discord.TextChannel) -> Optional[discord.Webhook]:
-        """Get or create a webhook in the channel for SOTD posts."""
+        """Get or create a webhook in the channel for SOTD posts (cached per channel)."""
+        cached = self._sotd_webhooks.get(channel.id)
+        if cached is not None:
+            return cached
         try:
             webhooks = await channel.webhooks()
-            for wh in webhooks:
-                if wh.name == "JuiceWRLD-SOTD" and wh.user == self.bot.user:
-                    return wh
-            return await channel.create_webhook(name="JuiceWRLD-SOTD")
+            webhook = next(
+                (wh for wh in webhooks if wh.name == "JuiceWRLD-SOTD" and wh.user == self.bot.user),
+                None,
+            )
+            if webhook is None:
+                webhook = await channel.create_webhook(name="JuiceWRLD-SOTD")
         except Exception:
             return None
+        self._sotd_webhooks[channel.id] = webhook
+        return webhook
 
 
     @_song_of_the_day_task.before_loop
@@ -168,74 +301,7 @@ class AdminCog(commands.Cog):
     async def help_command(self, ctx: commands.Context):
         """Show help for the bot commands in a clean, organized embed."""
 
-        embed = discord.Embed(title="Juice WRLD Bot Help", colour=discord.Colour.purple())
-
-        core_lines = [
-            "`!jw play <song_id>` — Play a song by ID in your voice channel.",
-            "`!jw search <query>` — Search songs with interactive Play/Playlist/Info buttons.",
-            "`!jw song <song_id>` — View song details with Play/Playlist/Info buttons.",
-            "`!jw radio` — Start radio mode (random songs until `!jw stop`).",
-            "`!jw stop` — Stop playback and turn off radio mode.",
-            "`!jw join` — Make the bot join your voice channel.",
-            "`!jw leave` — Disconnect the bot from voice.",
-            "`!jw link` — Get a link to connect your Discord account for linked roles.",
-            "`!jw ping` — Check if the bot is alive.",
-        ]
-        embed.add_field(name="Core Commands", value="\n".join(core_lines), inline=False)
-
-        comp_lines = [
-            "`!jw comp <name>` — Search Compilation and play the best match.",
-            "`!jw stusesh <name>` — Search Studio Sessions only.",
-            "`!jw og <name>` — Search Original Files only.",
-            "`!jw seshedits <name>` — Search Session Edits only.",
-            "`!jw stems <name>` — Search Stem Edits only.",
-            "`!jw playsearch <name>` — Search all comp files.",
-            "`!jw playfile <path>` — Play directly from a comp file path.",
-        ]
-        embed.add_field(name="Comp Playback", value="\n".join(comp_lines), inline=False)
-
-        playlist_lines = [
-            "`!jw pl` — List your playlists (also `!jw playlist` or `!jw playlists`).",
-            "`!jw pl show <name>` — Show full contents of a playlist.",
-            "`!jw pl play <name>` — Queue/play all tracks in a playlist.",
-            "`!jw pl add <name> <song_id>` — Add a song (by ID) to a playlist.",
-            "`!jw pl create <name>` — Create a new empty playlist.",
-            "`!jw pl delete <name>` — Delete a playlist.",
-            "`!jw pl rename <old> <new>` — Rename a playlist.",
-            "`!jw pl remove <name> <index>` — Remove a track by index.",
-            "`!jw pl share <name>` — Share a playlist publicly in the channel.",
-            "`!jw pl import @user <name>` — Copy another user's playlist.",
-        ]
-        embed.add_field(name="Playlists", value="\n".join(playlist_lines), inline=False)
-
-        browse_lines = [
-            "`!jw eras` — List all Juice WRLD musical eras.",
-            "`!jw era <name>` — Browse songs from a specific era.",
-            "`!jw similar` — Find songs similar to the currently playing track.",
-            "`!jw stats` — View your personal listening stats.",
-            "`!jw history` — Show the last 10 songs played in this server.",
-        ]
-        embed.add_field(name="Browse & Discover", value="\n".join(browse_lines), inline=False)
-
-        admin_lines = [
-            "`!jw sotd [#channel]` — Set/view the Song of the Day channel.",
-            "`!jw sotdtime [HH:MM]` — Set/view the SOTD announcement time (PT).",
-            "`!jw emoji list|upload|delete` — Manage application emojis.",
-            "`!jw sync` — Force-sync slash commands to Discord.",
-            "`!jw ver` — Show bot version and recent updates.",
-        ]
-        embed.add_field(name="Admin", value="\n".join(admin_lines), inline=False)
-
-        slash_lines = [
-            "All commands are also available as `/jw <command>`.",
-            "`/jw sotd` — View the current Song of the Day.",
-            "Type `/jw` in chat to see the full slash command list.",
-        ]
-        embed.add_field(name="Slash Commands", value="\n".join(slash_lines), inline=False)
-
-        embed.set_footer(text="Prefix: !jw  •  Aliases: !jw pl = !jw playlist = !jw playlists")
-
-        await ctx.send(embed=embed)
+        await ctx.send(embed=_HELP_EMBED)
 
 
     @commands.command(name="link")
@@ -294,8 +360,10 @@ class AdminCog(commands.Cog):
         msg = await ctx.send("Syncing slash commands...")
     
         try:
-            # Sync to this guild first (instant)
-            if ctx.guild:
+            # Per-guild sync is instant but costs a REST call per guild,
+            # so only do it for configured dev guilds.
+            guild_synced = bool(ctx.guild and ctx.guild.id in DEV_GUILD_IDS)
+            if guild_synced:
                 await self.bot.tree.sync(guild=ctx.guild)
                 await msg.edit(content=f"✅ Synced slash commands to **{ctx.guild.name}**!\n\n"
                                        f"The `/jw` commands should now be available in this server.\n"
@@ -304,13 +372,17 @@ class AdminCog(commands.Cog):
             # Sync globally (takes up to 1 hour to propagate)
             await self.bot.tree.sync()
 
+            guild_line = (
+                "• **Guild sync**: Instant (commands available now in this server)\n"
+                if guild_synced else ""
+            )
             await msg.edit(content=f"✅ Successfully synced slash commands!\n\n"
-                                   f"• **Guild sync**: Instant (commands available now in this server)\n"
+                                   f"{guild_line}"
                                    f"• **Global sync**: Started (may take up to 1 hour for other servers)\n\n"
                                    f"Try typing `/jw` to see the commands.")
 
             # Delete after 15 seconds
-            asyncio.create_task(helpers.delete_later(msg, 15))
+            helpers.schedule_message_deletion(msg, 15)
 
         except Exception as e:
             await msg.edit(content=f"❌ Error syncing commands: {e}")
@@ -321,26 +393,7 @@ class AdminCog(commands.Cog):
     async def version_command(self, ctx: commands.Context):
         """Show bot version information."""
     
-        embed = discord.Embed(
-            title="JuiceAPI Bot Version",
-            description=f"**Version:** {BOT_VERSION}\n**Build Date:** {BOT_BUILD_DATE}",
-            colour=discord.Colour.green(),
-        )
-        embed.add_field(
-            name="Recent Updates (v3.5.3)",
-            value=(
-                "• 🔍 Genius Lyrics Search — Improved matching for songs with alternate titles\n"
-                "• ℹ️ Info Button Fix — Fixed info button silently failing in `/jw search`\n"
-                "• 🔗 Linked Roles — Use `!jw link` to connect your Discord account\n"
-                "• 📊 Stats Tracking — Track plays, listen hours, and unique songs\n"
-                "• 🎵 Interactive song selection, lyrics, and snippets\n"
-                "• 🎤 Genius API fallback for lyrics"
-            ),
-            inline=False,
-        )
-        embed.set_footer(text="Use !jw help for all commands")
-    
-        await helpers.send_temporary(ctx, embed=embed, delay=15)
+        await helpers.send_temporary(ctx, embed=_VERSION_EMBED, delay=15)
 
 
     @commands.command(name="sotd")
@@ -9,17 +9,29 @@ from typing import Any, Dict, List, Optional
 import discord
 from discord.ext import commands, tasks
 
-from constants import AUTO_LEAVE_IDLE_SECONDS, BOT_VERSION, NOTHING_PLAYING
+from constants import (
+    AUTO_LEAVE_IDLE_SECONDS,
+    BOT_VERSION,
+    NOTHING_PLAYING,
+    PLAYER_IDLE_REFRESH_SECONDS,
+    PLAYER_REFRESH_SECONDS,
+)
 from exceptions import JuiceWRLDAPIError, NotFoundError
 import helpers
 import state
-from views.player import PlayerView, build_player_embed
+from views.player import PlayerView, build_player_embed, progress_bucket
 
 # FFmpeg options shared by all playback paths.
 _FFMPEG_BEFORE = "-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5"
 _FFMPEG_OPTIONS = "-vn"
 
 
+def _retrieve_quietly(task: "asyncio.Future[Any]") -> None:
+    """Mark a speculative lookup's error as handled if nobody awaits it."""
+    if not task.cancelled():
+        task.exception()
+
+
 class PlaybackCog(commands.Cog):
     """Voice playback, radio, queue management, and related commands."""
 
@@ -29,6 +41,8 @@ class PlaybackCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
+        # In-flight radio prefetches, so concurrent callers share one fetch.
+        self._radio_prefetches: Dict[int, asyncio.Task] = {}
         PlaybackCog._IDLE_STATUSES = [f"v{BOT_VERSION}", 'try "/jw"', "Idle play me", "link with !jw link"]
         self._update_player_messages.start()
         self._idle_auto_leave.start()
@@ -59,11 +73,10 @@ class PlaybackCog(commands.Cog):
             if message_id is not None and channel_id is not None:
                 guild_obj = self.bot.get_guild(guild_id)
                 if guild_obj:
-                    chan = guild_obj.get_channel(channel_id) or self.bot.get_channel(channel_id)
+                    chan = guild_obj.get_channel(channel_id)
                     if isinstance(chan, discord.TextChannel):
                         try:
-                            fetched = await chan.fetch_message(message_id)
-                            await fetched.delete()
+                            await chan.get_partial_message(message_id).delete()
                         except Exception:
                             pass
 
@@ -408,7 +421,7 @@ class PlaybackCog(commands.Cog):
             # Use current rotating idle status.
             idle_name = self._IDLE_STATUSES[self._idle_status_index % len(self._IDLE_STATUSES)]
             activity = discord.Activity(type=discord.ActivityType.playing, name=idle_name)
-        asyncio.create_task(self.bot.change_presence(activity=activity))
+        helpers.spawn(self.bot.change_presence(activity=activity))
 
     async def _send_player_controls(
         self,
@@ -439,11 +452,7 @@ class PlaybackCog(commands.Cog):
         )
 
         guild_id = ctx.guild.id
-        info = state.guild_now_playing.get(guild_id, {})
-        # Store a lightweight reference to ctx so the background task can
-        # reconstruct the view. Avoid storing the full object tree.
-        info.setdefault("ctx", ctx)
-        state.guild_now_playing[guild_id] = info
+        info = state.guild_now_playing.setdefault(guild_id, {})
         message_id = info.get("message_id")
         channel_id = info.get("channel_id")
 
@@ -459,28 +468,40 @@ class PlaybackCog(commands.Cog):
             is_radio=is_radio,
         )
 
-        view = PlayerView(ctx=ctx, is_radio=is_radio, queue_fn=self._queue_or_play_now, send_controls_fn=self._send_player_controls, radio_fn=self._play_random_song_in_guild, prefetch_fn=self._prefetch_next_radio_song)
+        self._wake_player_refresh()
+
+        # Reuse the view already attached to the player message when its
+        # inputs are unchanged, so the edit only has to carry the embed.
+        view = self._cached_player_view(info, ctx=ctx, is_radio=is_radio)
+        fresh_view = view is None
+        if view is None:
+            view = PlayerView(ctx=ctx, is_radio=is_radio, queue_fn=self._queue_or_play_now, send_controls_fn=self._send_player_controls, radio_fn=self._play_random_song_in_guild, prefetch_fn=self._prefetch_next_radio_song)
 
         # If we have a previously-sent player message, try to edit it.
         target_channel = ctx.channel
         if channel_id is not None and ctx.guild is not None:
-            chan = ctx.guild.get_channel(channel_id) or self.bot.get_channel(channel_id)
+            chan = ctx.guild.get_channel(channel_id)
             if isinstance(chan, discord.TextChannel):
                 target_channel = chan
 
         cached_msg = info.get("message_obj")
         if cached_msg is not None:
             try:
-                await cached_msg.edit(embed=embed, view=view)
+                if fresh_view:
+                    await cached_msg.edit(embed=embed, view=view)
+                else:
+                    await cached_msg.edit(embed=embed)
+                info["view"] = view
                 return
             except Exception:
                 # Cached object is stale (deleted, etc.) — fall through to send new.
                 pass
-        elif message_id is not None and isinstance(target_channel, discord.abc.Messageable):
+        elif message_id is not None and hasattr(target_channel, "get_partial_message"):
             try:
-                msg = await target_channel.fetch_message(message_id)
-                await msg.edit(embed=embed, view=view)
+                # Edit by ID; no need to fetch the message first.
+                msg = await target_channel.get_partial_message(message_id).edit(embed=embed, view=view)
                 state.guild_now_playing[guild_id]["message_obj"] = msg
+                info["view"] = view
                 return
             except Exception:
                 pass
@@ -490,29 +511,59 @@ class PlaybackCog(commands.Cog):
         state.guild_now_playing[guild_id]["message_id"] = sent.id
         state.guild_now_playing[guild_id]["channel_id"] = sent.channel.id
         state.guild_now_playing[guild_id]["message_obj"] = sent
+        info["view"] = view
+
+    @staticmethod
+    def _cached_player_view(
+        info: Dict[str, Any],
+        *,
+        ctx: Optional[commands.Context],
+        is_radio: bool,
+    ) -> Optional[PlayerView]:
+        """Return the view attached to the player message if it still fits.
+
+        A view is reusable while it is live, has the same radio mode and
+        (when *ctx* is given) was built for the same context.
+        """
+        view = info.get("view")
+        if not isinstance(view, PlayerView) or view.is_finished():
+            return None
+        if view.is_radio != is_radio or (ctx is not None and view.ctx is not ctx):
+            return None
+        return view
 
+    def _wake_player_refresh(self) -> None:
+        """Switch the progress refresh back to its fast interval."""
+        if self._update_player_messages.seconds != PLAYER_REFRESH_SECONDS:
+            self._update_player_messages.change_interval(seconds=PLAYER_REFRESH_SECONDS)
 
-    @tasks.loop(seconds=5)
+    @tasks.loop(seconds=PLAYER_REFRESH_SECONDS)
     async def _update_player_messages(self) -> None:
         """Periodically refresh Now Playing embeds with updated progress.
 
         This keeps the progress bar and elapsed time roughly in sync with
-        playback. Runs every 5 seconds for all guilds with a tracked
-        now-playing message.
+        playback.  Runs every ``PLAYER_REFRESH_SECONDS`` while any guild has
+        playback (playing or paused) and backs off to
+        ``PLAYER_IDLE_REFRESH_SECONDS`` otherwise.  A paused player is edited
+        once to show the pause and then left alone, since its progress
+        cannot change.
         """
 
-        for guild in list(state.guild_now_playing.keys()):
-            info = state.guild_now_playing.get(guild)
+        # Resolve everything synchronously from caches first, then issue
+        # every guild's edit concurrently so one slow edit doesn't delay
+        # the rest.
+        active = False
+        edits = []
+        # No awaits happen in this pass, so the dict cannot change under
+        # the iteration and needs no snapshot copy.
+        for guild, info in state.guild_now_playing.items():
             if not info:
                 continue
 
             message_id = info.get("message_id")
             channel_id = info.get("channel_id")
             title = info.get("title")
-            path = info.get("path")
             is_radio = bool(info.get("is_radio"))
-            metadata = info.get("metadata") or {}
-            duration_seconds = info.get("duration_seconds")
 
             if message_id is None or channel_id is None or not title:
                 continue
@@ -526,39 +577,88 @@ class PlaybackCog(commands.Cog):
             if not voice or not voice.is_connected() or not (voice.is_playing() or voice.is_paused()):
                 continue
 
-            # Use cached message object; fall back to fetch if not available.
+            # Paused players still count as active so a resume is picked up
+            # on the next fast tick.
+            active = True
+
+            # Skip the rebuild and edit when the embed would not change: same
+            # track, progress step, pause state and queue as the last render.  A
+            # paused player therefore stays untouched until it resumes.  With
+            # no known duration there is no progress bar, so the step is left
+            # out and only track, pause and queue changes trigger an edit.
+            paused_at = info.get("paused_at")
+            queue = state.guild_queue.get(guild)
+            radio_next = state.guild_radio_next.get(guild) or {}
+            fingerprint = (
+                info.get("started_at"),
+                progress_bucket(info.get("started_at"), paused_at, info.get("total_paused_time", 0))
+                if info.get("duration_seconds") else None,
+                bool(paused_at),
+                len(queue) if queue else 0,
+                queue[0].get("title") if queue else None,
+                radio_next.get("title"),
+                radio_next.get("path"),
+            )
+            if fingerprint == info.get("_last_fp"):
+                continue
+
+            # Use cached message object; otherwise edit by ID through a
+            # partial message (no fetch round-trip).
             msg = info.get("message_obj")
             if msg is None:
-                chan = guild_obj.get_channel(channel_id) or self.bot.get_channel(channel_id)
+                chan = guild_obj.get_channel(channel_id)
                 if not isinstance(chan, discord.TextChannel):
                     continue
-                try:
-                    msg = await chan.fetch_message(message_id)
-                    info["message_obj"] = msg
-                except Exception:
-                    # Message may have been deleted; stop tracking it.
-                    continue
+                msg = chan.get_partial_message(message_id)
 
             # Build embed using the centralized function
             embed = build_player_embed(
                 guild,
                 title=title,
-                metadata=metadata,
-                duration_seconds=duration_seconds,
+                metadata=info.get("metadata") or {},
+                duration_seconds=info.get("duration_seconds"),
                 started_at=info.get("started_at"),
-                paused_at=info.get("paused_at"),
+                paused_at=paused_at,
                 total_paused_time=info.get("total_paused_time", 0),
                 is_radio=is_radio,
             )
+            edits.append(self._refresh_player_message(info, msg, embed, is_radio, fingerprint))
 
-            view = PlayerView(ctx=info.get("ctx"), is_radio=is_radio, queue_fn=self._queue_or_play_now, send_controls_fn=self._send_player_controls, radio_fn=self._play_random_song_in_guild, prefetch_fn=self._prefetch_next_radio_song) if info.get("ctx") else None
-            try:
-                await msg.edit(embed=embed, view=view)
-            except Exception:
-                # Edit failed — message may be deleted. Clear cached object
-                # so the next tick falls back to fetch (or discovers it's gone).
-                info.pop("message_obj", None)
-                continue
+        if edits:
+            await asyncio.gather(*edits, return_exceptions=True)
+
+        seconds = PLAYER_REFRESH_SECONDS if active else PLAYER_IDLE_REFRESH_SECONDS
+        if self._update_player_messages.seconds != seconds:
+            self._update_player_messages.change_interval(seconds=seconds)
+
+    async def _refresh_player_message(
+        self,
+        info: Dict[str, Any],
+        msg: Any,
+        embed: discord.Embed,
+        is_radio: bool,
+        fingerprint: tuple,
+    ) -> None:
+        """Apply one guild's progress refresh edit (see ``_update_player_messages``)."""
+        try:
+            if self._cached_player_view(info, ctx=None, is_radio=is_radio) is not None:
+                info["message_obj"] = await msg.edit(embed=embed)
+            else:
+                # The previous view carries the only retained context.
+                ctx = getattr(info.get("view"), "ctx", None)
+                view = PlayerView(ctx=ctx, is_radio=is_radio, queue_fn=self._queue_or_play_now, send_controls_fn=self._send_player_controls, radio_fn=self._play_random_song_in_guild, prefetch_fn=self._prefetch_next_radio_song) if ctx else None
+                info["message_obj"] = await msg.edit(embed=embed, view=view)
+                info["view"] = view
+            info["_last_fp"] = fingerprint
+        except discord.NotFound:
+            # Message was deleted; stop tracking it so the next player
+            # update sends a fresh one.
+            info.pop("message_obj", None)
+            info.pop("message_id", None)
+        except Exception:
+            # Edit failed (transient error). Clear the cached object so
+            # the next tick retries by ID.
+            info.pop("message_obj", None)
 
 
     async def _auto_disconnect_guild(self, guild: discord.Guild, reason: str = "inactivity") -> None:
@@ -577,22 +677,22 @@ class PlaybackCog(commands.Cog):
 
         # Clear the bot's Discord activity status to idle rotation.
         idle_name = self._IDLE_STATUSES[self._idle_status_index % len(self._IDLE_STATUSES)]
-        asyncio.create_task(
+        helpers.spawn(
             self.bot.change_presence(activity=discord.Activity(type=discord.ActivityType.playing, name=idle_name))
         )
 
         # Delete the Now Playing message after a brief moment.
-        asyncio.create_task(self._delete_now_playing_message_after_delay(guild_id, 1))
+        helpers.spawn(self._delete_now_playing_message_after_delay(guild_id, 1))
 
         # Try to notify a text channel.
         info = state.guild_now_playing.get(guild_id)
         channel_id = info.get("channel_id") if info else None
         if channel_id:
-            chan = guild.get_channel(channel_id) or self.bot.get_channel(channel_id)
+            chan = guild.get_channel(channel_id)
             if isinstance(chan, discord.TextChannel):
                 try:
                     msg = await chan.send(f"Disconnected due to {reason}.")
-                    asyncio.create_task(helpers.delete_later(msg, 10))
+                    helpers.schedule_message_deletion(msg, 10)
                 except Exception:
                     pass
 
@@ -602,9 +702,11 @@ class PlaybackCog(commands.Cog):
         """Periodically check for guilds where the bot is idle and auto-leave."""
 
         now = time.time()
-        for guild in list(self.bot.guilds):
-            voice: Optional[discord.VoiceClient] = guild.voice_client  # type: ignore[assignment]
-            if not voice or not voice.is_connected():
+        # Only guilds with a voice connection can be idle; discord.py already
+        # tracks those, so there is no need to walk every guild.
+        for voice in list(self.bot.voice_clients):
+            guild = getattr(voice, "guild", None)
+            if guild is None or not isinstance(voice, discord.VoiceClient) or not voice.is_connected():
                 continue
 
             # If actively playing, refresh the timestamp and skip.
@@ -674,9 +776,8 @@ class PlaybackCog(commands.Cog):
         if voice.channel != before.channel:
             return
 
-        # Count non-bot members remaining.
-        human_members = [m for m in voice.channel.members if not m.bot]
-        if len(human_members) == 0:
+        # Leave once no non-bot members remain (stops at the first human).
+        if not any(not m.bot for m in voice.channel.members):
             await self._auto_disconnect_guild(guild, reason="everyone left the voice channel")
 
     @commands.command(name="join")
@@ -715,13 +816,16 @@ class PlaybackCog(commands.Cog):
             return
 
         state.guild_radio_enabled[ctx.guild.id] = True
-        await helpers.send_temporary(ctx, "Radio mode enabled. Playing random songs until you run `!jw stop`.")
+        notice = helpers.send_temporary(ctx, "Radio mode enabled. Playing random songs until you run `!jw stop`.")
 
         # If something is already playing, let it finish and the after-callback
-        # (if any) will continue the radio. Otherwise, start immediately.
+        # (if any) will continue the radio, with the first radio song fetched
+        # now. Otherwise, start immediately. The notice is sent alongside.
         voice: Optional[discord.VoiceClient] = ctx.voice_client
         if not voice or not voice.is_playing():
-            await self._play_random_song_in_guild(ctx)
+            await asyncio.gather(notice, self._play_random_song_in_guild(ctx))
+        else:
+            await asyncio.gather(notice, self._prefetch_next_radio_song(ctx.guild.id))
 
 
     @commands.command(name="stop")
@@ -773,14 +877,6 @@ class PlaybackCog(commands.Cog):
             await helpers.send_temporary(ctx, "You need to be in a voice channel to play music.", delay=5)
             return
 
-        # If radio is currently on, disable it; the requested song will
-        # either play next (if something else is already playing) or
-        # immediately if nothing is playing.
-        if disable_radio:
-            radio_was_on = self._disable_radio_if_active(ctx)
-            if radio_was_on:
-                await helpers.send_temporary(ctx, "Radio mode disabled because you requested a specific song.")
-
         # Support a short debug suffix: e.g. "123d" will enable debug mode
         # and use song ID 123. This keeps the command compact.
         debug = False
@@ -795,67 +891,81 @@ class PlaybackCog(commands.Cog):
             await helpers.send_temporary(ctx, "Song ID must be a number. Example: `!jw play 123`.", delay=5)
             return
 
-        voice = await helpers.ensure_voice_connected(ctx.guild, ctx.author)
+        # If radio is currently on, disable it; the requested song will
+        # either play next (if something else is already playing) or
+        # immediately if nothing is playing.
+        if disable_radio:
+            radio_was_on = self._disable_radio_if_active(ctx)
+            if radio_was_on:
+                await helpers.send_temporary(ctx, "Radio mode disabled because you requested a specific song.")
+
+        # Start the catalog lookup now so it overlaps the voice connect and
+        # player round-trips; both the fallback and the metadata step need it.
+        # On an early return it still completes and warms the song cache.
+        catalog_task = helpers.spawn(helpers.get_song_cached(song_id_int))
+        catalog_task.add_done_callback(_retrieve_quietly)
 
-        # First attempt: use the player endpoint helper to resolve a concrete
-        # file path / stream URL for this song ID.
+        # Resolve the stream under one typing indicator: voice connect,
+        # player endpoint, stream probe and catalog fallback.
         async with ctx.typing():
-            api = helpers.get_api()
-            player_result = await api.play_juicewrld_song(song_id_int)
-
-        status = player_result.get("status")
-        error_detail = player_result.get("error")
-
-        stream_url: Optional[str] = None
-        file_path: Optional[str] = player_result.get("file_path")
-        path_for_meta: Optional[str] = file_path
-
-        # Decide whether we should fall back to a comp-style resolution path.
-        fallback_needed = False
-        if status == "not_found":
-            # Song is not in the player endpoint – we will try to resolve it via
-            # the main song catalog + comp browser.
-            fallback_needed = True
-        elif status and status not in {"success", "file_not_found_but_url_provided"}:
-            # API-level error from the player helper, prefer comp-style fallback.
-            fallback_needed = True
-
-        # If the player endpoint claims success or a soft file-not-found, try to
-        # validate/stream its file path first.
-        if not fallback_needed and file_path:
-            async with ctx.typing():
-                stream_result = await api.stream_audio_file(file_path)
+            # First attempt: use the player endpoint helper to resolve a concrete
+            # file path / stream URL for this song ID, while joining voice.
+            voice, player_result = await asyncio.gather(
+                helpers.ensure_voice_connected(ctx.guild, ctx.author),
+                helpers.get_player_result(song_id_int),
+            )
 
-            stream_status = stream_result.get("status")
-            stream_error = stream_result.get("error")
+            status = player_result.get("status")
+            error_detail = player_result.get("error")
 
-            if stream_status == "success":
-                stream_url = stream_result.get("stream_url")
-                if not stream_url:
-                    # Missing URL from a "success" response – treat as fallback.
-                    fallback_needed = True
-                else:
-                    path_for_meta = file_path
-            else:
-                # The derived comp path did not actually stream; fall back.
-                fallback_needed = True
+            stream_url: Optional[str] = None
+            file_path: Optional[str] = player_result.get("file_path")
+            path_for_meta: Optional[str] = file_path
 
-        elif not fallback_needed and not file_path:
-            # No file path from player endpoint; try its direct stream_url.
-            direct_url = player_result.get("stream_url")
-            if direct_url:
-                stream_url = direct_url
-                path_for_meta = file_path
-            else:
+            # Decide whether we should fall back to a comp-style resolution path.
+            fallback_needed = False
+            if status == "not_found":
+                # Song is not in the player endpoint – we will try to resolve it via
+                # the main song catalog + comp browser.
+                fallback_needed = True
+            elif status and status not in {"success", "file_not_found_but_url_provided"}:
+                # API-level error from the player helper, prefer comp-style fallback.
                 fallback_needed = True
 
-        # Second attempt: comp-style fallback using the main song catalog and
-        # file browser (similar to !jw comp / _play_from_browse).
-        if fallback_needed or not stream_url:
-            async with ctx.typing():
+            # If the player endpoint claims success or a soft file-not-found, try to
+            # validate/stream its file path first.
+            if not fallback_needed and file_path:
+                stream_result = await helpers.get_stream_result(file_path)
+
+                stream_status = stream_result.get("status")
+                stream_error = stream_result.get("error")
+
+                if stream_status == "success":
+                    stream_url = stream_result.get("stream_url")
+                    if not stream_url:
+                        # Missing URL from a "success" response – treat as fallback.
+                        fallback_needed = True
+                    else:
+                        path_for_meta = file_path
+                else:
+                    # The derived comp path did not actually stream; fall back.
+                    fallback_needed = True
+
+            elif not fallback_needed and not file_path:
+                # No file path from player endpoint; try its direct stream_url.
+                direct_url = player_result.get("stream_url")
+                if direct_url:
+                    stream_url = direct_url
+                    path_for_meta = file_path
+                else:
+                    fallback_needed = True
+
+            # Second attempt: comp-style fallback using the main song catalog and
+            # file browser (similar to !jw comp / _play_from_browse).
+            if fallback_needed or not stream_url:
                 api = helpers.get_api()
                 try:
-                    song_obj = await api.get_song(song_id_int)
+                    song_obj = await catalog_task
                 except NotFoundError:
                     await helpers.send_temporary(
                         ctx,
@@ -876,7 +986,7 @@ class PlaybackCog(commands.Cog):
 
                 if comp_path:
                     file_path = comp_path
-                    stream_result = await api.stream_audio_file(file_path)
+                    stream_result = await helpers.get_stream_result(file_path)
                 else:
                     # No direct path on the song; search the comp browser by
                     # song title under the Compilation tree.
@@ -906,7 +1016,7 @@ class PlaybackCog(commands.Cog):
                         )
                         return
 
-                    stream_result = await api.stream_audio_file(file_path)
+                    stream_result = await helpers.get_stream_result(file_path)
 
                 stream_status = stream_result.get("status")
                 stream_error = stream_result.get("error")
@@ -931,10 +1041,10 @@ class PlaybackCog(commands.Cog):
 
                 path_for_meta = file_path
                 catalog_song_obj = song_obj
-        else:
-            # We already have a usable stream_url from the player endpoint path
-            # or its direct URL. We'll still fetch catalog metadata below.
-            catalog_song_obj = None
+            else:
+                # We already have a usable stream_url from the player endpoint path
+                # or its direct URL. We'll still fetch catalog metadata below.
+                catalog_song_obj = None
 
         if not voice:
             await helpers.send_temporary(ctx, "Internal error: voice client not available.", delay=5)
@@ -956,7 +1066,7 @@ class PlaybackCog(commands.Cog):
             # Reuse the catalog song we fetched during fallback if available;
             # otherwise look it up now.
             if catalog_song_obj is None:
-                catalog_song_obj = await helpers.get_api().get_song(song_id_int)
+                catalog_song_obj = await catalog_task
 
             song_obj = catalog_song_obj
 
@@ -1006,7 +1116,7 @@ class PlaybackCog(commands.Cog):
         voice = await helpers.ensure_voice_connected(ctx.guild, ctx.author)
 
         async with ctx.typing():
-            result = await helpers.get_api().stream_audio_file(file_path)
+            result = await helpers.get_stream_result(file_path)
 
         status = result.get("status")
         error_detail = result.get("error")
@@ -1165,7 +1275,7 @@ class PlaybackCog(commands.Cog):
                 )
                 return
 
-            result = await api.stream_audio_file(file_path)
+            result = await helpers.get_stream_result(file_path)
 
         status = result.get("status")
         error_detail = result.get("error")
@@ -1313,10 +1423,24 @@ class PlaybackCog(commands.Cog):
         """Pre-fetch the next random radio song for a guild and store it.
     
         Only fetches metadata (not stream URL) to avoid stale URLs when the song is played later.
+        Idempotent: returns at once if a song is already queued up, and
+        joins a fetch that is already running for the guild.
         """
-        song_data = await self._fetch_random_radio_song(include_stream_url=False)
-        if song_data:
-            state.guild_radio_next[guild_id] = song_data
+        if guild_id in state.guild_radio_next:
+            return
+        task = self._radio_prefetches.get(guild_id)
+        if task is None or task.done():
+            task = helpers.spawn(self._fetch_radio_next(guild_id))
+            self._radio_prefetches[guild_id] = task
+        await asyncio.shield(task)
+
+    async def _fetch_radio_next(self, guild_id: int) -> None:
+        try:
+            song_data = await self._fetch_random_radio_song(include_stream_url=False)
+            if song_data:
+                state.guild_radio_next[guild_id] = song_data
+        finally:
+            self._radio_prefetches.pop(guild_id, None)
 
 
     async def _play_random_song_in_guild(self, ctx: commands.Context) -> None:
@@ -1384,7 +1508,7 @@ class PlaybackCog(commands.Cog):
             # Try again with a new song after a short delay
             await asyncio.sleep(1)
             if state.guild_radio_enabled.get(guild_id):
-                asyncio.create_task(self._play_random_song_in_guild(ctx))
+                helpers.spawn(self._play_random_song_in_guild(ctx))
             return
 
         if not ctx.guild or not state.guild_radio_enabled.get(ctx.guild.id):
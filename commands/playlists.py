@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional
 import discord
 from discord.ext import commands
 
+from constants import NO_PLAYLISTS_MESSAGE
 from exceptions import JuiceWRLDAPIError, NotFoundError
 import helpers
 import state
@@ -33,10 +34,7 @@ class PlaylistsCog(commands.Cog):
         user = ctx.author
         playlists = state.user_playlists.get(user.id) or {}
         if not playlists:
-            await ctx.send(
-                "You don't have any playlists yet. Use ❤ Like on the player to add "
-                "the current song to your Likes playlist."
-            )
+            await ctx.send(NO_PLAYLISTS_MESSAGE)
             return
 
         embed = helpers.build_playlists_embed_for_user(user, playlists)
@@ -60,20 +58,16 @@ class PlaylistsCog(commands.Cog):
         # Paginate into embeds (20 tracks per page) to avoid truncation.
         per_page = 20
         total = len(playlist)
+        total_pages = -(-total // per_page)  # ceil division
         pages: list[discord.Embed] = []
         for start in range(0, total, per_page):
-            page_tracks = playlist[start : start + per_page]
             lines: list[str] = []
-            for idx, track in enumerate(page_tracks, start=start + 1):
-                tname = track.get("name") or track.get("id") or "Unknown"
+            for idx, track in enumerate(playlist[start : start + per_page], start=start + 1):
                 tid = track.get("id")
-                piece = f"`{idx}.` {tname}"
-                if tid is not None:
-                    piece += f" (ID: {tid})"
-                lines.append(piece)
+                id_part = f" (ID: {tid})" if tid is not None else ""
+                lines.append(f"`{idx}.` {track.get('name') or tid or 'Unknown'}{id_part}")
 
             page_num = start // per_page + 1
-            total_pages = -(-total // per_page)  # ceil division
             footer = f"Page {page_num}/{total_pages} • {total} track(s)" if total_pages > 1 else f"{total} track(s)"
 
             embed = discord.Embed(
@@ -119,14 +113,13 @@ class PlaylistsCog(commands.Cog):
             await ctx.send("Internal error: voice client not available.")
             return
 
-        queued = 0
-        for track in playlist:
-            file_path = track.get("path")
-            if not file_path:
-                continue
-
-            result = await helpers.get_api().stream_audio_file(file_path)
+        # Resolve every track's stream concurrently, then queue in playlist order.
+        tracks = [t for t in playlist if t.get("path")]
+        results = await helpers.resolve_stream_urls([t["path"] for t in tracks])
 
+        queued = 0
+        for track, result in zip(tracks, results):
+            file_path = track["path"]
             status = result.get("status")
             if status != "success":
                 continue
@@ -178,9 +171,6 @@ class PlaylistsCog(commands.Cog):
             await ctx.send("Playlist name cannot be empty.")
             return
 
-        playlists = state.get_or_create_user_playlists(ctx.author.id)
-        playlist = playlists.setdefault(playlist_name, [])
-
         # Parse song ID
         try:
             song_id_int = int(song_id_str)
@@ -190,7 +180,7 @@ class PlaylistsCog(commands.Cog):
 
         # Resolve a comp file path for this song using the player endpoint.
         async with ctx.typing():
-            player_result = await helpers.get_api().play_juicewrld_song(song_id_int)
+            player_result = await helpers.get_player_result(song_id_int)
 
         status = player_result.get("status")
         error_detail = player_result.get("error")
@@ -226,7 +216,7 @@ class PlaylistsCog(commands.Cog):
         # Fetch full song metadata for display and future playback.
         async with ctx.typing():
             try:
-                song_obj = await helpers.get_api().get_song(song_id_int)
+                song_obj = await helpers.get_song_cached(song_id_int)
             except Exception:
                 song_obj = None
 
@@ -243,26 +233,23 @@ class PlaylistsCog(commands.Cog):
         title = str(meta.get("name") or f"Song {song_id_int}")
         song_id_val = meta.get("id") or meta.get("song_id")
 
-        # Avoid duplicates: match by song ID or path
-        for track in playlist:
-            if song_id_val is not None and track.get("id") == song_id_val:
-                await ctx.send(f"`{title}` is already in playlist `{playlist_name}`.")
-                return
-            if file_path and track.get("path") == file_path:
-                await ctx.send(f"`{title}` is already in playlist `{playlist_name}`.")
-                return
+        # Avoid duplicates: match by song ID or path (indexed per playlist).
+        ids, paths = state.playlist_index(ctx.author.id, playlist_name)
+        if (song_id_val is not None and song_id_val in ids) or (file_path and file_path in paths):
+            await ctx.send(f"`{title}` is already in playlist `{playlist_name}`.")
+            return
 
-        playlist.append(
+        state.append_playlist_track(
+            ctx.author.id,
+            playlist_name,
             {
                 "id": song_id_val,
                 "name": title,
                 "path": file_path,
                 "metadata": meta,
                 "added_at": time.time(),
-            }
+            },
         )
-
-        state.save_user_playlists_to_disk()
         await ctx.send(f"Added `{title}` (ID `{song_id_int}`) to playlist `{playlist_name}`.")
 
 
@@ -280,7 +267,7 @@ class PlaylistsCog(commands.Cog):
             # If the user now has no playlists, remove their entry entirely.
             state.user_playlists.pop(ctx.author.id, None)
 
-        state.save_user_playlists_to_disk()
+        state.schedule_playlists_save()
         await ctx.send(f"Deleted playlist `{name}`.")
 
 
@@ -298,7 +285,7 @@ class PlaylistsCog(commands.Cog):
             return
 
         playlists[new] = playlists.pop(old)
-        state.save_user_playlists_to_disk()
+        state.schedule_playlists_save()
         await ctx.send(f"Renamed playlist `{old}` to `{new}`.")
 
 
@@ -308,16 +295,20 @@ class PlaylistsCog(commands.Cog):
 
         playlists = state.user_playlists.get(ctx.author.id) or {}
         playlist = playlists.get(name)
-        if not playlist:
+        if playlist is None:
             await ctx.send(f"No playlist named `{name}` found.")
             return
 
+        if not playlist:
+            await ctx.send(f"Playlist `{name}` is empty.")
+            return
+
         if index < 1 or index > len(playlist):
             await ctx.send(f"Index {index} is out of range for playlist `{name}` (size {len(playlist)}).")
             return
 
         removed = playlist.pop(index - 1)
-        state.save_user_playlists_to_disk()
+        state.schedule_playlists_save()
 
         title = removed.get("name") or removed.get("id") or "Unknown track"
         await ctx.send(f"Removed `{title}` (index {index}) from playlist `{name}`.")
@@ -369,24 +360,15 @@ class PlaylistsCog(commands.Cog):
         my_playlists = state.get_or_create_user_playlists(ctx.author.id)
 
         # Generate a unique name if there's a conflict.
-        new_name = name
-        counter = 1
-        while new_name in my_playlists:
-            new_name = f"{name} ({counter})"
-            counter += 1
+        new_name = helpers.unique_playlist_name(name, my_playlists)
 
+        now = time.time()
         copied = [
-            {
-                "id": t.get("id"),
-                "name": t.get("name"),
-                "path": t.get("path"),
-                "metadata": t.get("metadata", {}),
-                "added_at": time.time(),
-            }
+            {**t, "metadata": dict(t.get("metadata") or {}), "added_at": now}
             for t in source
         ]
         my_playlists[new_name] = copied
-        state.save_user_playlists_to_disk()
+        state.schedule_playlists_save()
 
         await ctx.send(
             f"Imported `{name}` from {user.display_name} as `{new_name}` ({len(copied)} track(s))."
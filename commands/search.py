@@ -31,12 +31,11 @@ class SearchCog(commands.Cog):
     async def list_eras(self, ctx: commands.Context):
         """List all Juice WRLD musical eras."""
 
-        async with ctx.typing():
-            try:
-                eras = await helpers.get_api().get_eras()
-            except JuiceWRLDAPIError as e:
-                await helpers.send_temporary(ctx, f"Error fetching eras: {e}")
-                return
+        try:
+            eras = await helpers.await_with_typing(ctx, helpers.get_eras_cached())
+        except JuiceWRLDAPIError as e:
+            await helpers.send_temporary(ctx, f"Error fetching eras: {e}")
+            return
 
         if not eras:
             await helpers.send_temporary(ctx, "No eras found.")
@@ -86,12 +85,11 @@ class SearchCog(commands.Cog):
             await helpers.send_temporary(ctx, "This command can only be used in a server.")
             return
 
-        async with ctx.typing():
-            try:
-                title, top = await helpers.find_similar_songs(ctx.guild.id)
-            except JuiceWRLDAPIError as e:
-                await helpers.send_temporary(ctx, f"Error finding similar songs: {e}")
-                return
+        try:
+            title, top = await helpers.await_with_typing(ctx, helpers.find_similar_songs(ctx.guild.id))
+        except JuiceWRLDAPIError as e:
+            await helpers.send_temporary(ctx, f"Error finding similar songs: {e}")
+            return
 
         if not title:
             await helpers.send_temporary(ctx, "Nothing is currently playing. Play a song first!")
@@ -118,12 +116,11 @@ class SearchCog(commands.Cog):
     async def search_songs(self, ctx: commands.Context, *, query: str):
         """Search for songs by text query and show paginated interactive results."""
 
-        async with ctx.typing():
-            try:
-                results = await helpers.get_api().get_songs(search=query, page=1, page_size=25)
-            except JuiceWRLDAPIError as e:
-                await helpers.send_temporary(ctx, f"Error while searching songs: {e}")
-                return
+        try:
+            results = await helpers.await_with_typing(ctx, helpers.search_songs_page(query))
+        except JuiceWRLDAPIError as e:
+            await helpers.send_temporary(ctx, f"Error while searching songs: {e}")
+            return
 
         songs = results.get("results") or []
         if not songs:
@@ -155,15 +152,14 @@ class SearchCog(commands.Cog):
             await ctx.send("Song ID must be a number. Example: `!jw song 123`.")
             return
 
-        async with ctx.typing():
-            try:
-                song = await helpers.get_api().get_song(song_id_int)
-            except NotFoundError:
-                await ctx.send(f"No song found with ID `{song_id_int}`.")
-                return
-            except JuiceWRLDAPIError as e:
-                await ctx.send(f"Error while fetching song: {e}")
-                return
+        try:
+            song = await helpers.await_with_typing(ctx, helpers.get_song_cached(song_id_int))
+        except NotFoundError:
+            await ctx.send(f"No song found with ID `{song_id_int}`.")
+            return
+        except JuiceWRLDAPIError as e:
+            await ctx.send(f"Error while fetching song: {e}")
+            return
 
         view = SingleSongResultView(ctx=ctx, song=song, query=song_id, play_fn=self._play_fn, queue_fn=self._queue_fn)
         embed = view.build_embed()
@@ -1,11 +1,17 @@
 """Slash command Cog for the Juice WRLD Discord bot (/jw group)."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from constants import NO_PLAYLISTS_MESSAGE
 from exceptions import JuiceWRLDAPIError, NotFoundError
 import helpers
 import state
@@ -19,12 +25,13 @@ async def era_autocomplete(
 ) -> List[app_commands.Choice[str]]:
     """Autocomplete callback for era names."""
     try:
-        eras = await helpers.get_api().get_eras()
+        index = await helpers.get_era_name_index()
+        needle = current.lower()
         choices = []
-        for era in eras:
-            name = era.name or ""
-            if current and current.lower() not in name.lower():
+        for lower_name, era in index:
+            if needle and needle not in lower_name:
                 continue
+            name = era.name or ""
             display = f"{name} ({era.time_frame})" if era.time_frame else name
             if len(display) > 100:
                 display = display[:97] + "..."
@@ -35,6 +42,52 @@ async def era_autocomplete(
     except Exception:
         return []
 
+# Formatted song choices per normalized query: key -> (built_at, choices).
+# Repeated keystrokes and the default page are served from memory; queries
+# with no choices (typos) are kept longer.
+_SONG_AC_TTL = 30.0
+_SONG_AC_NEG_TTL = 60.0
+_SONG_AC_MAX = 256
+_song_ac_cache: "OrderedDict[str, Tuple[float, List[app_commands.Choice[str]]]]" = OrderedDict()
+
+# Latest in-flight autocomplete interaction per user.  A cache miss queries
+# at once unless an earlier lookup for that user is still running; then it
+# waits briefly and gives up if a newer keystroke arrives meanwhile.
+_SONG_AC_DEBOUNCE = 0.2
+_song_ac_latest: Dict[int, int] = {}
+
+
+def _is_song_id(query: str) -> bool:
+    """True for an ASCII numeric song ID, e.g. an autocomplete selection.
+
+    Long free-text queries are rejected before the digit scan, and
+    non-ASCII digits (which ``int()`` would not accept) never match.
+    """
+    return 0 < len(query) <= 10 and query.isascii() and query.isdigit()
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_choice_name(name: str, length: str) -> str:
+    """Format "Song Name - Duration", truncated to Discord's 100-char limit."""
+    display = f"{name} - {length}"
+    return display if len(display) <= 100 else display[:97] + "..."
+
+
+def _playable_songs(songs: List[Any]) -> Iterator[Tuple[str, str, Any]]:
+    """Yield ``(song_id, length, song)`` for songs worth offering.
+
+    Songs with no duration are skipped — they almost never have playable
+    audio files regardless of category.
+    """
+    for song in songs:
+        song_id = getattr(song, "id", None)
+        if not song_id:
+            continue
+        length = (getattr(song, "length", "") or "").strip()
+        if length:
+            yield str(song_id), length, song
+
+
 async def song_autocomplete(
     interaction: discord.Interaction,
     current: str,
@@ -45,46 +98,49 @@ async def song_autocomplete(
     Only includes songs that have a duration (length), which is the
     strongest indicator that an audio file exists for the song.
     """
+    # Inputs shorter than two characters all show the same default page.
+    key = current.strip().lower() if current and len(current) >= 2 else ""
+    now = time.monotonic()
+    hit = _song_ac_cache.get(key)
+    if hit is not None and now - hit[0] < (_SONG_AC_TTL if hit[1] else _SONG_AC_NEG_TTL):
+        _song_ac_cache.move_to_end(key)
+        return hit[1]
+
+    user_id = interaction.user.id
+    busy = user_id in _song_ac_latest
+    _song_ac_latest[user_id] = interaction.id
     try:
+        if busy:
+            await asyncio.sleep(_SONG_AC_DEBOUNCE)
+            if _song_ac_latest.get(user_id) != interaction.id:
+                return []
+
         api = helpers.get_api()
-        if current and len(current) >= 2:
-            results = await api.get_songs(search=current, page=1, page_size=25)
+        if key:
+            results = await api.get_songs(search=key, page=1, page_size=25)
         else:
             # No input yet — show a default page of songs so the user sees options.
             results = await api.get_songs(page=1, page_size=25)
         
         songs = results.get("results") or []
         choices = []
-        
-        for song in songs:
-            if len(choices) >= 25:  # Discord allows max 25 choices
-                break
-
-            song_id = getattr(song, "id", None)
-            if not song_id:
-                continue
-
-            length = (getattr(song, "length", "") or "").strip()
-
-            # Skip songs with no duration — they almost never have
-            # playable audio files regardless of category.
-            if not length:
-                continue
+        Choice = app_commands.Choice
 
+        # Discord allows max 25 choices; stop scanning once we have them.
+        for song_id, length, song in islice(_playable_songs(songs), 25):
             name = getattr(song, "name", getattr(song, "title", "Unknown"))
-            
-            # Format: "Song Name - Duration" (max 100 chars for display)
-            display_name = f"{name} - {length}"
-            
-            # Truncate if too long (Discord limit is 100 chars)
-            if len(display_name) > 100:
-                display_name = display_name[:97] + "..."
-            
-            choices.append(app_commands.Choice(name=display_name, value=str(song_id)))
-        
+            choices.append(Choice(name=_fmt_choice_name(name, length), value=song_id))
+
+        _song_ac_cache[key] = (now, choices)
+        _song_ac_cache.move_to_end(key)
+        if len(_song_ac_cache) > _SONG_AC_MAX:
+            _song_ac_cache.popitem(last=False)
         return choices
     except Exception:
         return []
+    finally:
+        if _song_ac_latest.get(user_id) == interaction.id:
+            del _song_ac_latest[user_id]
 
 
 
@@ -126,7 +182,7 @@ class SlashCog(commands.GroupCog, group_name="jw"):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            eras = await helpers.get_api().get_eras()
+            eras = await helpers.get_eras_cached()
         except JuiceWRLDAPIError as e:
             await interaction.followup.send(f"Error fetching eras: {e}", ephemeral=True)
             return
@@ -213,7 +269,7 @@ class SlashCog(commands.GroupCog, group_name="jw"):
     
         # Check if query is a song ID (from autocomplete) or a search term
         song_id = None
-        if query.isdigit():
+        if _is_song_id(query):
             song_id = query
         else:
             # Search for the song
@@ -261,11 +317,11 @@ class SlashCog(commands.GroupCog, group_name="jw"):
         ctx = await commands.Context.from_interaction(interaction)
 
         # Check if query is a song ID (from autocomplete selection)
-        api = helpers.get_api()
-        if query.isdigit():
-            # Fetch the specific song by ID
+        if _is_song_id(query):
+            # Resolve through the detail endpoint: search results lack the
+            # comp path that add-to-playlist and its duplicate check need.
             try:
-                song = await api.get_song(int(query))
+                song = await helpers.get_song_cached(int(query))
                 view = SingleSongResultView(ctx=ctx, song=song, query=query, play_fn=self._playback.play_song, queue_fn=self._queue_fn)
                 embed = view.build_embed()
                 await interaction.followup.send(embed=embed, view=view, ephemeral=True)
@@ -284,7 +340,7 @@ class SlashCog(commands.GroupCog, group_name="jw"):
 
         # Regular search query
         try:
-            results = await api.get_songs(search=query, page=1, page_size=25)
+            results = await helpers.search_songs_page(query)
         except JuiceWRLDAPIError as e:
             await interaction.followup.send(
                 f"Error while searching songs: {e}", ephemeral=True
@@ -321,7 +377,7 @@ class SlashCog(commands.GroupCog, group_name="jw"):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            song = await helpers.get_api().get_song(song_id)
+            song = await helpers.get_song_cached(song_id)
         except NotFoundError:
             await interaction.followup.send(
                 f"No song found with ID `{song_id}`.", ephemeral=True
@@ -413,13 +469,18 @@ class SlashCog(commands.GroupCog, group_name="jw"):
         # If something is already playing, let it finish naturally.
         # The after-callback will detect radio is enabled and start playing
         # random songs once the current track ends.
+        # Either way, the confirmation is sent while the song fetch runs.
         voice: Optional[discord.VoiceClient] = guild.voice_client if guild else None
         if voice and (voice.is_playing() or voice.is_paused()):
-            await self._playback._prefetch_next_radio_song(guild.id)
-            await helpers.send_ephemeral_temporary(interaction, "Radio enabled. Current song will finish, then radio starts.", delay=5)
+            await asyncio.gather(
+                self._playback._prefetch_next_radio_song(guild.id),
+                helpers.send_ephemeral_temporary(interaction, "Radio enabled. Current song will finish, then radio starts.", delay=5),
+            )
         else:
-            await helpers.send_ephemeral_temporary(interaction, "Radio mode enabled. Playing random songs until you run `/jw stop`.")
-            await self._playback._play_random_song_in_guild(ctx)
+            await asyncio.gather(
+                helpers.send_ephemeral_temporary(interaction, "Radio mode enabled. Playing random songs until you run `/jw stop`."),
+                self._playback._play_random_song_in_guild(ctx),
+            )
 
 
     @app_commands.command(name="stop", description="Stop playback and disable radio mode.")
@@ -460,11 +521,7 @@ class SlashCog(commands.GroupCog, group_name="jw"):
         playlists = state.user_playlists.get(user.id) or {}
 
         if not playlists:
-            await interaction.response.send_message(
-                "You don't have any playlists yet. Use ❤ Like on the player to "
-                "add the current song to your Likes playlist.",
-                ephemeral=True,
-            )
+            await interaction.response.send_message(NO_PLAYLISTS_MESSAGE, ephemeral=True)
             return
 
         # Build a Context to drive playback when buttons are pressed.
@@ -6,9 +6,20 @@ import os
 # codebase should use this constant instead of a raw string literal.
 NOTHING_PLAYING = "Nothing playing"
 
+# Shown by every "list my playlists" entry point when the user has none.
+NO_PLAYLISTS_MESSAGE = (
+    "You don't have any playlists yet. Use ❤ Like on the player to add "
+    "the current song to your Likes playlist."
+)
+
 # How long (seconds) of no playback before auto-leaving voice.
 AUTO_LEAVE_IDLE_SECONDS = 30 * 60  # 30 minutes
 
+# Player embed refresh interval while something is playing, and the
+# slower interval used when every tracked player is idle or paused.
+PLAYER_REFRESH_SECONDS = 5
+PLAYER_IDLE_REFRESH_SECONDS = 30
+
 # Persistent data file paths (next to this file on disk).
 _HERE = os.path.dirname(os.path.abspath(__file__))
 PLAYLISTS_FILE = os.path.join(_HERE, "playlists.json")
@@ -24,3 +35,9 @@ BOT_BUILD_DATE = "2026-03-01"
 DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
 JUICEWRLD_API_BASE_URL = os.getenv("JUICEWRLD_API_BASE_URL", "https://juicewrldapi.com")
 GENIUS_API_TOKEN = os.getenv("GENIUS_API_TOKEN")  # Optional: for lyrics fallback
+
+# Guilds that get an instant per-guild slash sync from `!jw sync`
+# (comma-separated IDs).  Everywhere else relies on the global sync.
+DEV_GUILD_IDS = frozenset(
+    int(g) for g in os.getenv("DEV_GUILD_IDS", "").split(",") if g.strip().isdigit()
+)
@@ -6,10 +6,16 @@ importable from anywhere without circular-import issues.
 """
 
 import asyncio
+import functools
+import heapq
+import itertools
 import os
+import re
 import time
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
+import aiohttp
 import discord
 from discord.ext import commands
 
@@ -54,6 +60,32 @@ def get_genius() -> Optional[GeniusClient]:
     return _genius_client
 
 
+# ── Shared Discord REST session ──────────────────────────────────────
+
+_discord_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_discord_session() -> aiohttp.ClientSession:
+    """Return a shared aiohttp session for raw Discord REST calls."""
+    global _discord_session
+    if _discord_session is None or _discord_session.closed:
+        _discord_session = aiohttp.ClientSession()
+    return _discord_session
+
+
+async def close_all() -> None:
+    """Close every shared HTTP client (call once during bot shutdown)."""
+    global _discord_session, _genius_client
+    await state.flush_pending_writes()
+    await close_api()
+    if _genius_client is not None:
+        await _genius_client.close()
+        _genius_client = None
+    if _discord_session is not None and not _discord_session.closed:
+        await _discord_session.close()
+    _discord_session = None
+
+
 # ── Parsing / formatting helpers ─────────────────────────────────────
 
 def parse_length_to_seconds(length: str) -> Optional[int]:
@@ -73,14 +105,27 @@ def parse_length_to_seconds(length: str) -> Optional[int]:
     return None
 
 
-def format_progress_bar(current: int, total: Optional[int], width: int = 10) -> str:
-    """Return a simple text progress bar and time display."""
+def progress_bar_glyphs(current: int, total: int, width: int = 10) -> str:
+    """Return just the ``▮▯`` bar for *current* out of *total* seconds."""
+    current = max(0, min(current, total))
+    filled = int(width * (current / total))
+    return "▮" * filled + "▯" * (width - filled)
+
+
+def format_progress_bar(
+    current: int, total: Optional[int], width: int = 10, *, bar: Optional[str] = None
+) -> str:
+    """Return a simple text progress bar and time display.
+
+    *bar* may supply pre-rendered glyphs (e.g. cached per refresh step);
+    the time display always uses the exact *current*.
+    """
     if not total or total <= 0 or current <= 0:
         return f"00:00 / {time.strftime('%M:%S', time.gmtime(total)) if total else '?:??'}"
 
+    if bar is None:
+        bar = progress_bar_glyphs(current, total, width)
     current = max(0, min(current, total))
-    filled = int(width * (current / total))
-    bar = "▮" * filled + "▯" * (width - filled)
     return f"{bar} {time.strftime('%M:%S', time.gmtime(current))} / {time.strftime('%M:%S', time.gmtime(total))}"
 
 
@@ -159,6 +204,27 @@ def build_song_metadata_from_song(
     return meta
 
 
+# ── Playlist naming ──────────────────────────────────────────────────
+
+_COPY_SUFFIX_RE = re.compile(r"^(.*) \((\d+)\)$")
+
+
+def unique_playlist_name(base_name: str, existing: Dict[str, Any]) -> str:
+    """Return *base_name*, or ``"base_name (N)"`` if it is already taken.
+
+    *N* is one past the highest existing suffix for that base name, found
+    in a single pass over *existing*.
+    """
+    if base_name not in existing:
+        return base_name
+    highest = 0
+    for name in existing:
+        m = _COPY_SUFFIX_RE.match(name)
+        if m and m.group(1) == base_name:
+            highest = max(highest, int(m.group(2)))
+    return f"{base_name} ({highest + 1})"
+
+
 # ── Voice connection helper ───────────────────────────────────────────
 
 async def ensure_voice_connected(
@@ -170,9 +236,10 @@ async def ensure_voice_connected(
     Returns the :class:`discord.VoiceClient` on success, or ``None`` if
     the user is not currently in a voice channel.
     """
-    if not user.voice or not user.voice.channel:
+    user_voice = user.voice
+    channel = user_voice.channel if user_voice else None
+    if not channel:
         return None
-    channel = user.voice.channel
     voice: Optional[discord.VoiceClient] = guild.voice_client  # type: ignore[assignment]
     if voice and voice.is_connected():
         if voice.channel != channel:
@@ -183,6 +250,14 @@ async def ensure_voice_connected(
 
 # ── Stream error helper ───────────────────────────────────────────────
 
+# Message templates per stream failure status; anything else falls back
+# to the generic status message.
+_STREAM_ERROR_TEMPLATES: Dict[str, str] = {
+    "file_not_found": "Audio file not found for {subject}.",
+    "http_error": "Could not stream {subject} (HTTP error). Details: {detail}",
+}
+
+
 async def handle_stream_error(
     ctx: commands.Context,
     *,
@@ -195,42 +270,256 @@ async def handle_stream_error(
     *subject* is interpolated into the message, e.g.
     ``"song `123`"`` or ``"file `path/to/song.mp3`"``.
     """
-    if status == "file_not_found":
-        await send_temporary(ctx, f"Audio file not found for {subject}.", delay=5)
-    elif status == "http_error":
-        await send_temporary(
-            ctx,
-            f"Could not stream {subject} (HTTP error). "
-            f"Details: {error_detail or status}",
-            delay=5,
-        )
+    template = _STREAM_ERROR_TEMPLATES.get(status)
+    if template is not None:
+        message = template.format(subject=subject, detail=error_detail or status)
     else:
         detail_suffix = f" Details: {error_detail}" if error_detail else ""
-        await send_temporary(
-            ctx,
-            f"Could not stream {subject} (status: {status}).{detail_suffix}",
-            delay=5,
-        )
+        message = f"Could not stream {subject} (status: {status}).{detail_suffix}"
+    await send_temporary(ctx, message, delay=5)
+
+
+# ── Single-flight lookups ────────────────────────────────────────────
+
+# In-flight upstream lookups by (kind, key); concurrent cache misses for
+# the same key await one request instead of each issuing their own.
+_inflight: Dict[Tuple[str, Any], asyncio.Task] = {}
+
+
+async def _single_flight(key: Tuple[str, Any], factory: Callable[[], Awaitable[Any]]) -> Any:
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _inflight[key] = task
+        task.add_done_callback(lambda _t: _inflight.pop(key, None))
+    # Shielded so one cancelled caller doesn't cancel the shared lookup.
+    return await asyncio.shield(task)
+
+
+# ── Stream URL cache ─────────────────────────────────────────────────
+
+# Successful stream probes per comp path: path -> (fetched_at, result).
+_STREAM_TTL = 300
+_STREAM_CACHE_MAX = 256
+_stream_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+async def get_stream_result(path: str, *, timeout: Optional[float] = None) -> Dict[str, Any]:
+    """Return ``stream_audio_file(path)``, reusing a recent successful probe.
+
+    Only ``success`` results are cached (TTL ``_STREAM_TTL`` seconds, at
+    most ``_STREAM_CACHE_MAX`` paths, least recently used evicted first).
+    """
+    now = time.monotonic()
+    hit = _stream_cache.get(path)
+    if hit is not None and now - hit[0] < _STREAM_TTL:
+        _stream_cache.move_to_end(path)
+        return hit[1]
+
+    result = await _single_flight(
+        ("stream", path), lambda: get_api().stream_audio_file(path, timeout=timeout)
+    )
+    if result.get("status") == "success":
+        _stream_cache[path] = (now, result)
+        _stream_cache.move_to_end(path)
+        if len(_stream_cache) > _STREAM_CACHE_MAX:
+            _stream_cache.popitem(last=False)
+    else:
+        _stream_cache.pop(path, None)
+    return result
+
+
+# ── Empty search cache ───────────────────────────────────────────────
+
+# Normalized queries that recently found nothing -> when that was seen,
+# so a retried typo doesn't hit the API again for a minute.
+_EMPTY_SEARCH_TTL = 60
+_EMPTY_SEARCH_MAX = 256
+_empty_searches: "OrderedDict[str, float]" = OrderedDict()
+
+
+async def search_songs_page(query: str) -> Dict[str, Any]:
+    """Return the first 25-song ``get_songs(search=query)`` page.
+
+    Queries that came back empty within ``_EMPTY_SEARCH_TTL`` seconds
+    return an empty page without calling the API.
+    """
+    key = query.strip().lower()
+    now = time.monotonic()
+    seen = _empty_searches.get(key)
+    if seen is not None and now - seen < _EMPTY_SEARCH_TTL:
+        return {"results": [], "count": 0}
+
+    results = await get_api().get_songs(search=query, page=1, page_size=25)
+    if results.get("results"):
+        _empty_searches.pop(key, None)
+    else:
+        _empty_searches[key] = now
+        _empty_searches.move_to_end(key)
+        if len(_empty_searches) > _EMPTY_SEARCH_MAX:
+            _empty_searches.popitem(last=False)
+    return results
+
+
+# ── Song detail cache ────────────────────────────────────────────────
+
+# Catalog songs by ID: song_id -> (fetched_at, song).  Details, play and
+# playlist lookups of the same song share one fetch.
+_SONG_TTL = 600
+_SONG_CACHE_MAX = 1024
+_song_cache: "OrderedDict[int, Tuple[float, Any]]" = OrderedDict()
+
+
+async def get_song_cached(song_id: int) -> Any:
+    """Return ``get_song(song_id)``, reusing a fetch from the last ``_SONG_TTL`` seconds.
+
+    Errors (including ``NotFoundError``) propagate and are not cached.
+    """
+    now = time.monotonic()
+    hit = _song_cache.get(song_id)
+    if hit is not None and now - hit[0] < _SONG_TTL:
+        _song_cache.move_to_end(song_id)
+        return hit[1]
+
+    song = await _single_flight(("song", song_id), lambda: get_api().get_song(song_id))
+    _song_cache[song_id] = (now, song)
+    _song_cache.move_to_end(song_id)
+    if len(_song_cache) > _SONG_CACHE_MAX:
+        _song_cache.popitem(last=False)
+    return song
+
+
+# ── Player endpoint cache ────────────────────────────────────────────
+
+# Successful player-endpoint resolutions: song_id -> (fetched_at, result).
+# Kept short because a result may carry a direct stream URL.
+_PLAYER_TTL = 60
+_PLAYER_CACHE_MAX = 256
+_player_cache: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+async def get_player_result(song_id: int) -> Dict[str, Any]:
+    """Return ``play_juicewrld_song(song_id)``, reusing a recent success.
+
+    Only ``success`` results are cached (TTL ``_PLAYER_TTL`` seconds).
+    """
+    now = time.monotonic()
+    hit = _player_cache.get(song_id)
+    if hit is not None and now - hit[0] < _PLAYER_TTL:
+        _player_cache.move_to_end(song_id)
+        return hit[1]
+
+    result = await _single_flight(
+        ("player", song_id), lambda: get_api().play_juicewrld_song(song_id)
+    )
+    if result.get("status") == "success":
+        _player_cache[song_id] = (now, result)
+        _player_cache.move_to_end(song_id)
+        if len(_player_cache) > _PLAYER_CACHE_MAX:
+            _player_cache.popitem(last=False)
+    else:
+        _player_cache.pop(song_id, None)
+    return result
+
+
+# ── Era list cache ───────────────────────────────────────────────────
+
+# Eras change rarely; autocomplete reuses one fetch for an hour.
+# Cached as (fetched_at, eras, [(lowercased name, era), …]).
+_ERAS_TTL = 3600
+_eras_cache: Optional[Tuple[float, List[Any], List[Tuple[str, Any]]]] = None
+
+
+async def _load_eras() -> Tuple[float, List[Any], List[Tuple[str, Any]]]:
+    global _eras_cache
+    now = time.monotonic()
+    if _eras_cache is None or now - _eras_cache[0] >= _ERAS_TTL:
+        eras = await get_api().get_eras()
+        _eras_cache = (now, eras, [((era.name or "").lower(), era) for era in eras])
+    return _eras_cache
+
+
+async def get_eras_cached() -> List[Any]:
+    """Return ``get_eras()``, refetching at most once per ``_ERAS_TTL`` seconds."""
+    return (await _load_eras())[1]
+
+
+async def get_era_name_index() -> List[Tuple[str, Any]]:
+    """Return cached ``(lowercased name, era)`` pairs for substring matching."""
+    return (await _load_eras())[2]
+
+
+async def prime_eras_cache() -> None:
+    """Warm the era cache in the background; a failure just leaves it cold."""
+    try:
+        await _load_eras()
+    except Exception:
+        pass
+
+
+# ── Batched stream resolution ────────────────────────────────────────
+
+async def resolve_stream_urls(
+    paths: List[str],
+    *,
+    concurrency: int = 8,
+) -> List[Dict[str, Any]]:
+    """Resolve many comp file paths to stream results concurrently.
+
+    Results are returned in the same order as *paths*.  At most
+    *concurrency* probes are in flight at once so large playlists don't
+    flood the API.  A failed probe yields a ``request_error`` result.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _resolve(path: str) -> Dict[str, Any]:
+        async with sem:
+            return await get_stream_result(path)
+
+    results = await asyncio.gather(*(_resolve(p) for p in paths), return_exceptions=True)
+    return [
+        r if isinstance(r, dict) else {"status": "request_error", "error": str(r)}
+        for r in results
+    ]
 
 
 # ── Similar songs ────────────────────────────────────────────────────
 
+# Candidate lists keyed by (era name, category).  The playing track
+# changes slowly, so repeated "similar" lookups share one fetch.
+_SIMILAR_TTL = 300
+_SIMILAR_MAX = 128
+_similar_cache: "OrderedDict[Tuple[str, str], Tuple[float, List[Any]]]" = OrderedDict()
+
+# Eras whose first page last came back with fewer than 5 songs.  For these
+# the category fallback is near-certain, so both pages are fetched at once.
+_short_eras: Set[str] = set()
+
+
+@functools.lru_cache(maxsize=256)
+def _producer_set(producers_str: str) -> FrozenSet[str]:
+    """Split a comma-separated producers credit into stripped names."""
+    return frozenset(p for p in map(str.strip, producers_str.split(",")) if p)
+
+
 def score_similarity(
     song: Any,
     *,
     era_name: Optional[str],
-    producers_str: str,
+    producers: FrozenSet[str],
     category: str,
 ) -> int:
-    """Score a candidate song's similarity to a reference track."""
+    """Score a candidate song's similarity to a reference track.
+
+    *producers* is the reference track's producer names, already split
+    and stripped, so the per-candidate work is just substring checks.
+    """
     sc = 0
     s_era = getattr(getattr(song, "era", None), "name", "")
     if era_name and s_era == era_name:
         sc += 2
     s_prod = getattr(song, "producers", "") or ""
-    if producers_str and s_prod and any(
-        p.strip() in s_prod for p in producers_str.split(",") if p.strip()
-    ):
+    if producers and s_prod and any(p in s_prod for p in producers):
         sc += 3
     if category and getattr(song, "category", "") == category:
         sc += 1
@@ -250,43 +539,72 @@ async def find_similar_songs(
     if not info or not title or title == NOTHING_PLAYING:
         return None, []
 
-    meta = info.get("metadata") or {}
-    era_val = meta.get("era")
-    era_name: Optional[str] = None
-    if isinstance(era_val, dict):
-        era_name = era_val.get("name")
-    elif era_val:
-        era_name = str(era_val)
-
-    producers_str = meta.get("producers") or ""
-    category = meta.get("category") or ""
-
-    candidates: List[Any] = []
-    api = get_api()
-    try:
-        if era_name:
-            res = await api.get_songs(era=era_name, page=1, page_size=25)
-            candidates = res.get("results") or []
-        if len(candidates) < 5 and category:
-            res2 = await api.get_songs(category=category, page=1, page_size=25)
-            existing_ids = {getattr(s, "id", None) for s in candidates}
-            for s in (res2.get("results") or []):
-                if getattr(s, "id", None) not in existing_ids:
-                    candidates.append(s)
-    except JuiceWRLDAPIError:
-        return title, []
-
-    candidates = [s for s in candidates if getattr(s, "name", None) != title]
-    candidates.sort(
-        key=lambda s: score_similarity(
-            s,
+    get = (info.get("metadata") or {}).get
+    era_val = get("era")
+    era_name: Optional[str] = (
+        era_val.get("name") if isinstance(era_val, dict) else (str(era_val) if era_val else None)
+    )
+    producers = _producer_set(get("producers") or "")
+    category = get("category") or ""
+
+    key = (era_name or "", category)
+    now = time.monotonic()
+    cached = _similar_cache.get(key)
+    if cached and now - cached[0] < _SIMILAR_TTL:
+        _similar_cache.move_to_end(key)
+        fetched = cached[1]
+    else:
+        # The category page is only needed when the era alone gives fewer
+        # than 5 songs: fetch it alongside the era page when that era was
+        # short last time, otherwise only after the era page comes back
+        # short.  Failed lookups are not cached.
+        api = get_api()
+        fetched = []
+        res2 = None
+        try:
+            if era_name:
+                if category and era_name in _short_eras:
+                    res, res2 = await asyncio.gather(
+                        api.get_songs(era=era_name, page=1, page_size=25),
+                        api.get_songs(category=category, page=1, page_size=25),
+                    )
+                else:
+                    res = await api.get_songs(era=era_name, page=1, page_size=25)
+                fetched = list(res.get("results") or [])
+                if len(fetched) < 5:
+                    _short_eras.add(era_name)
+                else:
+                    _short_eras.discard(era_name)
+            if len(fetched) < 5 and category:
+                if res2 is None:
+                    res2 = await api.get_songs(category=category, page=1, page_size=25)
+                seen = {getattr(s, "id", None) for s in fetched}
+                for s in res2.get("results") or []:
+                    sid = getattr(s, "id", None)
+                    if sid not in seen:
+                        seen.add(sid)
+                        fetched.append(s)
+        except JuiceWRLDAPIError:
+            return title, []
+        _similar_cache[key] = (now, fetched)
+        _similar_cache.move_to_end(key)
+        if len(_similar_cache) > _SIMILAR_MAX:
+            _similar_cache.popitem(last=False)
+
+    candidates = [s for s in fetched if getattr(s, "name", None) != title]
+    # Bind the reference track's attributes once; only the top 10 are
+    # kept, so select them instead of sorting every candidate.
+    top = heapq.nlargest(
+        10,
+        candidates,
+        key=functools.partial(
+            score_similarity,
             era_name=era_name,
-            producers_str=producers_str,
+            producers=producers,
             category=category,
         ),
-        reverse=True,
     )
-    return title, candidates[:10]
+    return title, top
 
 
 # ── Leave voice ─────────────────────────────────────────────────────
@@ -309,29 +627,106 @@ async def leave_voice_channel(
     if guild:
         state.guild_radio_enabled[guild.id] = False
         state.guild_radio_next.pop(guild.id, None)
-        asyncio.create_task(delete_np_callback(guild.id, 1))
+        spawn(delete_np_callback(guild.id, 1))
 
     await voice.disconnect()
     return True
 
 
-# ── Discord message helpers ──────────────────────────────────────────
+# ── Background tasks ─────────────────────────────────────────────────
+
+# Strong references to fire-and-forget tasks so they aren't GC'd mid-run.
+_background_tasks: set = set()
+
+
+def spawn(coro) -> asyncio.Task:
+    """Schedule *coro* as a retained background task."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
 
-async def delete_later(message: discord.Message, delay: int) -> None:
-    """Delete a message after a delay, ignoring failures."""
+# ── Typing indicator ─────────────────────────────────────────────────
+
+async def await_with_typing(ctx: commands.Context, awaitable: Awaitable[Any], *, grace: float = 0.2) -> Any:
+    """Await *awaitable*, showing "typing…" only if it takes over *grace* seconds.
+
+    Cache hits resolve well inside the grace period and so skip the
+    typing request to Discord entirely.
+    """
+    task = asyncio.ensure_future(awaitable)
+    try:
+        done, _ = await asyncio.wait({task}, timeout=grace)
+        if done:
+            return task.result()
+        async with ctx.typing():
+            return await task
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+
+
+# ── Delayed deletions ────────────────────────────────────────────────
+
+# Temporary messages are deleted by one janitor task working through a
+# deadline heap, instead of one sleeping task per message.
+_deletions: List[Tuple[float, int, Callable[[], Awaitable[Any]]]] = []
+_deletion_seq = itertools.count()
+_deletions_changed = asyncio.Event()
+_janitor: Optional[asyncio.Task] = None
+
+
+def _schedule_deletion(delete: Callable[[], Awaitable[Any]], delay: float) -> None:
+    """Call *delete* once *delay* seconds have passed, ignoring failures."""
+    global _janitor
+    heapq.heappush(_deletions, (time.monotonic() + delay, next(_deletion_seq), delete))
+    _deletions_changed.set()
+    if _janitor is None or _janitor.done():
+        _janitor = asyncio.create_task(_deletion_janitor())
+
+
+async def _delete_quietly(delete: Callable[[], Awaitable[Any]]) -> None:
     try:
-        await asyncio.sleep(delay)
-        await message.delete()
+        await delete()
     except Exception:
-        return
+        pass
+
+
+async def _deletion_janitor() -> None:
+    while True:
+        _deletions_changed.clear()
+        if not _deletions:
+            await _deletions_changed.wait()
+            continue
+        wait = _deletions[0][0] - time.monotonic()
+        if wait > 0:
+            # Wake early if a sooner deadline is scheduled meanwhile.
+            try:
+                await asyncio.wait_for(_deletions_changed.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+            continue
+        # Start each due deletion in its own task so a slow or rate-limited
+        # delete never holds up later deadlines.
+        now = time.monotonic()
+        while _deletions and _deletions[0][0] <= now:
+            spawn(_delete_quietly(heapq.heappop(_deletions)[2]))
+
+
+def schedule_message_deletion(message: discord.Message, delay: float) -> None:
+    """Delete *message* after *delay* seconds, ignoring failures."""
+    _schedule_deletion(message.delete, delay)
 
 
+# ── Discord message helpers ──────────────────────────────────────────
+
 async def send_temporary(
     ctx: commands.Context, content: str = None, delay: int = 10, embed: discord.Embed = None
 ) -> None:
     """Send a status message that auto-deletes after *delay* seconds."""
     msg = await ctx.send(content, embed=embed)
-    asyncio.create_task(delete_later(msg, delay))
+    schedule_message_deletion(msg, delay)
 
 
 async def send_ephemeral_temporary(
@@ -339,18 +734,12 @@ async def send_ephemeral_temporary(
 ) -> None:
     """Send an ephemeral followup message that auto-deletes after *delay* seconds."""
     msg = await interaction.followup.send(content, ephemeral=True, wait=True)
-    asyncio.create_task(delete_later(msg, delay))
+    schedule_message_deletion(msg, delay)
 
 
 def schedule_interaction_deletion(interaction: discord.Interaction, delay: int) -> None:
     """Schedule an interaction's original response to be deleted after a delay."""
-    async def _delete_after_delay() -> None:
-        await asyncio.sleep(delay)
-        try:
-            await interaction.delete_original_response()
-        except Exception:
-            pass
-    asyncio.create_task(_delete_after_delay())
+    _schedule_deletion(interaction.delete_original_response, delay)
 
 
 # ── Embed builders ───────────────────────────────────────────────────
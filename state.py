@@ -5,9 +5,16 @@ stats, and SOTD config live here.  Persistence helpers (load/save JSON)
 are co-located so any module can call them without importing bot.py.
 """
 
+import asyncio
 import json
+import os
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional: faster playlist (de)serialisation
+    orjson = None
 
 from constants import (
     NOTHING_PLAYING,
@@ -62,6 +69,50 @@ sotd_time: Dict[str, int] = {"hour": 12, "minute": 0}
 current_sotd: Optional[Dict[str, Any]] = None
 
 
+# ── Background writes ────────────────────────────────────────────────
+
+# Last scheduled write per file, so writes to one file land in order.
+_last_write: Dict[str, asyncio.Task] = {}
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialise *data* to compact UTF-8 JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Replace *path* atomically so readers never see a partial file."""
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except Exception:
+        return
+
+
+async def _write_after(prev: Optional[asyncio.Task], path: str, data: bytes) -> None:
+    if prev is not None and not prev.done():
+        await asyncio.wait([prev])
+    await asyncio.to_thread(_write_bytes, path, data)
+
+
+def _write_in_background(path: str, data: bytes) -> None:
+    """Write *data* to *path* off the event loop (inline if no loop runs).
+
+    The caller serialises on the loop so the snapshot is consistent; only
+    the file I/O moves to a worker thread.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _write_bytes(path, data)
+        return
+    _last_write[path] = loop.create_task(_write_after(_last_write.get(path), path, data))
+
+
 # ── Playlist helpers ─────────────────────────────────────────────────
 
 def get_or_create_user_playlists(user_id: int) -> Dict[str, List[Dict[str, Any]]]:
@@ -73,6 +124,39 @@ def get_or_create_user_playlists(user_id: int) -> Dict[str, List[Dict[str, Any]]
     return playlists
 
 
+# Lookup sets per (user_id, playlist name): generation, track list, ids, paths.
+# Every playlist mutation ends in schedule_playlists_save(), which bumps the
+# generation, so a stale index is rebuilt on its next use.
+_playlists_generation = 0
+_playlist_indexes: Dict[Tuple[int, str], Tuple[int, List[Dict[str, Any]], Set[Any], Set[str]]] = {}
+
+
+def playlist_index(user_id: int, name: str) -> Tuple[Set[Any], Set[str]]:
+    """Return ``(ids, paths)`` sets for a user's playlist, creating it if needed."""
+    tracks = get_or_create_user_playlists(user_id).setdefault(name, [])
+    key = (user_id, name)
+    entry = _playlist_indexes.get(key)
+    if entry is None or entry[0] != _playlists_generation or entry[1] is not tracks:
+        ids = {t.get("id") for t in tracks if t.get("id") is not None}
+        paths = {t.get("path") for t in tracks if t.get("path")}
+        entry = (_playlists_generation, tracks, ids, paths)
+        _playlist_indexes[key] = entry
+    return entry[2], entry[3]
+
+
+def append_playlist_track(user_id: int, name: str, track: Dict[str, Any]) -> None:
+    """Append *track* to a playlist, keep its index current and schedule a save."""
+    ids, paths = playlist_index(user_id, name)
+    tracks = user_playlists[user_id][name]
+    tracks.append(track)
+    if track.get("id") is not None:
+        ids.add(track["id"])
+    if track.get("path"):
+        paths.add(track["path"])
+    schedule_playlists_save()
+    _playlist_indexes[(user_id, name)] = (_playlists_generation, tracks, ids, paths)
+
+
 def _serialize_user_playlists_for_json() -> Dict[str, Any]:
     data: Dict[str, Any] = {}
     for uid, playlists in user_playlists.items():
@@ -80,12 +164,18 @@ def _serialize_user_playlists_for_json() -> Dict[str, Any]:
     return data
 
 
+def _dumps_user_playlists() -> bytes:
+    return _dumps(_serialize_user_playlists_for_json())
+
+
 def load_user_playlists_from_disk() -> None:
     """Load user playlists from disk into memory (best-effort)."""
-    global user_playlists
+    global user_playlists, _playlists_generation
+    _playlists_generation += 1
     try:
-        with open(PLAYLISTS_FILE, "r", encoding="utf-8") as f:
-            raw = json.load(f)
+        with open(PLAYLISTS_FILE, "rb") as f:
+            blob = f.read()
+        raw = orjson.loads(blob) if orjson is not None else json.loads(blob)
     except (FileNotFoundError, Exception):
         return
     if not isinstance(raw, dict):
@@ -105,10 +195,73 @@ def load_user_playlists_from_disk() -> None:
 def save_user_playlists_to_disk() -> None:
     """Persist user playlists to disk (best-effort)."""
     try:
-        with open(PLAYLISTS_FILE, "w", encoding="utf-8") as f:
-            json.dump(_serialize_user_playlists_for_json(), f, ensure_ascii=False)
+        data = _dumps_user_playlists()
     except Exception:
         return
+    _write_bytes(PLAYLISTS_FILE, data)
+
+
+# Debounced playlist writes: bursts of edits collapse into one disk write.
+PLAYLISTS_SAVE_DELAY = 0.5
+_playlists_dirty = False
+_playlists_save_task: Optional[asyncio.Task] = None
+
+
+async def _flush_playlists_later() -> None:
+    global _playlists_dirty
+    while _playlists_dirty:
+        await asyncio.sleep(PLAYLISTS_SAVE_DELAY)
+        _playlists_dirty = False
+        # Serialise on the loop (consistent snapshot), write off the loop.
+        try:
+            data = _dumps_user_playlists()
+        except Exception:
+            continue
+        await asyncio.to_thread(_write_bytes, PLAYLISTS_FILE, data)
+
+
+def schedule_playlists_save() -> None:
+    """Mark playlists dirty and flush them to disk shortly (coalesced).
+
+    Falls back to an immediate synchronous write when no event loop is
+    running.
+    """
+    global _playlists_dirty, _playlists_save_task, _playlists_generation
+    _playlists_dirty = True
+    _playlists_generation += 1
+    if _playlists_save_task is not None and not _playlists_save_task.done():
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _playlists_dirty = False
+        save_user_playlists_to_disk()
+        return
+    _playlists_save_task = loop.create_task(_flush_playlists_later())
+
+
+async def flush_playlists_save() -> None:
+    """Write any pending playlist changes now (call on shutdown).
+
+    A debounced save already in flight is awaited rather than cancelled:
+    cancelling would not stop its worker-thread write.
+    """
+    global _playlists_dirty, _playlists_save_task
+    if _playlists_save_task is not None and not _playlists_save_task.done():
+        await asyncio.wait([_playlists_save_task])
+    _playlists_save_task = None
+    if _playlists_dirty:
+        _playlists_dirty = False
+        save_user_playlists_to_disk()
+
+
+async def flush_pending_writes() -> None:
+    """Flush pending playlist changes and wait for queued stats/history writes."""
+    await flush_playlists_save()
+    pending = [t for t in _last_write.values() if not t.done()]
+    if pending:
+        await asyncio.wait(pending)
+    _last_write.clear()
 
 
 # ── Listening stats helpers ──────────────────────────────────────────
@@ -133,14 +286,17 @@ def load_listening_stats_from_disk() -> None:
         user_listening_stats = loaded
 
 
+def _dumps_listening_stats() -> bytes:
+    return _dumps({str(uid): data for uid, data in user_listening_stats.items()})
+
+
 def save_listening_stats_to_disk() -> None:
     """Persist listening stats to disk (best-effort)."""
     try:
-        serialized = {str(uid): data for uid, data in user_listening_stats.items()}
-        with open(STATS_FILE, "w", encoding="utf-8") as f:
-            json.dump(serialized, f, ensure_ascii=False)
+        data = _dumps_listening_stats()
     except Exception:
         return
+    _write_bytes(STATS_FILE, data)
 
 
 def record_listen(
@@ -167,7 +323,11 @@ def record_listen(
         eras = stats.setdefault("eras", {})
         eras[era_name] = eras.get(era_name, 0) + 1
 
-    save_listening_stats_to_disk()
+    try:
+        data = _dumps_listening_stats()
+    except Exception:
+        return
+    _write_in_background(STATS_FILE, data)
 
 
 # ── SOTD config helpers ──────────────────────────────────────────────
@@ -236,14 +396,17 @@ def load_history_from_disk() -> None:
         guild_history = loaded
 
 
+def _dumps_history() -> bytes:
+    return _dumps({str(gid): entries for gid, entries in guild_history.items()})
+
+
 def save_history_to_disk() -> None:
     """Persist guild play history to disk (best-effort)."""
     try:
-        serialized = {str(gid): entries for gid, entries in guild_history.items()}
-        with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-            json.dump(serialized, f, ensure_ascii=False)
+        data = _dumps_history()
     except Exception:
         return
+    _write_bytes(HISTORY_FILE, data)
 
 
 def push_history(guild_id: int, entry: Dict[str, Any]) -> None:
@@ -252,7 +415,11 @@ def push_history(guild_id: int, entry: Dict[str, Any]) -> None:
     history.insert(0, entry)
     if len(history) > HISTORY_MAX_LENGTH:
         del history[HISTORY_MAX_LENGTH:]
-    save_history_to_disk()
+    try:
+        data = _dumps_history()
+    except Exception:
+        return
+    _write_in_background(HISTORY_FILE, data)
 
 
 # ── Explicit initialisation ───────────────────────────────────────
@@ -1,18 +1,38 @@
 """Player-related UI views for the Juice WRLD Discord bot."""
 
+import functools
 import time
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import random
 import discord
 from discord.ext import commands
 
-from constants import NOTHING_PLAYING, JUICEWRLD_API_BASE_URL
+from constants import NOTHING_PLAYING, JUICEWRLD_API_BASE_URL, NO_PLAYLISTS_MESSAGE
 import helpers
 import state
 from urllib.parse import quote
 from views.playlist import PlaylistPaginationView
 
 
+# Embed colours are immutable, so build them once rather than per embed.
+_LYRICS_COLOUR = discord.Colour.yellow()
+_SNIPPETS_COLOUR = discord.Colour.blurple()
+
+
+def _unpack_np(
+    info: Dict[str, Any],
+) -> Tuple[str, Optional[str], Dict[str, Any], bool, Optional[int]]:
+    """Return ``(title, path, metadata, is_radio, duration_seconds)`` from now-playing info."""
+    get = info.get
+    return (
+        str(get("title", "Unknown")),
+        get("path"),
+        get("metadata") or {},
+        bool(get("is_radio")),
+        get("duration_seconds"),
+    )
+
+
 class LyricsPaginationView(discord.ui.View):
     """Ephemeral paginated view for displaying lyrics with section headers."""
 
@@ -62,7 +82,7 @@ class LyricsPaginationView(discord.ui.View):
         embed = discord.Embed(
             title=f"🎵 Lyrics — {self.title}",
             description=self.pages[self.current_page],
-            colour=discord.Colour.yellow(),
+            colour=_LYRICS_COLOUR,
         )
         footer = f"Page {self.current_page + 1}/{self.total_pages} • Powered by Genius"
         if self.url:
@@ -226,7 +246,7 @@ class SnippetsPaginationView(discord.ui.View):
         embed = discord.Embed(
             title=f"📹 Snippets — {self.song_title}",
             description=f"**{f['name']}**",
-            colour=discord.Colour.blurple(),
+            colour=_SNIPPETS_COLOUR,
         )
         embed.set_footer(text=f"Snippet {self.current_page + 1}/{self.total_pages} • Video posted below ↓")
         return embed
@@ -418,7 +438,7 @@ class NowPlayingInfoView(discord.ui.View):
         embed = discord.Embed(
             title=f"🎵 Lyrics — {title}",
             description=f"Found **{len(candidates)}** versions on Genius. Pick the correct one:",
-            colour=discord.Colour.yellow(),
+            colour=_LYRICS_COLOUR,
         )
         await interaction.followup.send(embed=embed, view=select_view, ephemeral=True)
 
@@ -450,7 +470,7 @@ class NowPlayingInfoView(discord.ui.View):
                 return
 
             title = str(info.get("title", "Unknown"))
-            ctx = info.get("ctx")
+            ctx = getattr(info.get("view"), "ctx", None)
 
         await interaction.response.defer(ephemeral=True)
 
@@ -552,13 +572,14 @@ class RadioQueueConfirmView(discord.ui.View):
         if voice and (voice.is_playing() or voice.is_paused()):
             await self._prefetch_fn(guild.id)
             info = state.guild_now_playing.get(guild.id, {})
+            title, path, meta, _, duration = _unpack_np(info)
             await self._send_controls_fn(
                 self.ctx,
-                title=info.get("title", "Unknown"),
-                path=info.get("path"),
+                title=title,
+                path=path,
                 is_radio=True,
-                metadata=info.get("metadata", {}),
-                duration_seconds=info.get("duration_seconds"),
+                metadata=meta,
+                duration_seconds=duration,
             )
             await interaction.response.edit_message(
                 content="🗑️ Queue cleared. Radio will start after the current song.",
@@ -586,13 +607,14 @@ class RadioQueueConfirmView(discord.ui.View):
 
         await self._prefetch_fn(guild.id)
         info = state.guild_now_playing.get(guild.id, {})
+        title, path, meta, _, duration = _unpack_np(info)
         await self._send_controls_fn(
             self.ctx,
-            title=info.get("title", "Unknown"),
-            path=info.get("path"),
+            title=title,
+            path=path,
             is_radio=True,
-            metadata=info.get("metadata", {}),
-            duration_seconds=info.get("duration_seconds"),
+            metadata=meta,
+            duration_seconds=duration,
         )
         queue = state.guild_queue.get(guild.id, [])
         await interaction.response.edit_message(
@@ -629,10 +651,7 @@ class PlayerView(discord.ui.View):
 
         # Hide radio button if radio is already on
         if is_radio:
-            for child in self.children[:]:
-                if isinstance(child, discord.ui.Button) and child.label == "📻 Radio":
-                    self.remove_item(child)
-                    break
+            self.remove_item(self.radio_button)
 
     async def _get_voice(self) -> Optional[discord.VoiceClient]:
         return self.ctx.voice_client
@@ -651,25 +670,21 @@ class PlayerView(discord.ui.View):
             await helpers.send_ephemeral_temporary(interaction, "No active playback.")
             return
 
+        # Bind the now-playing entry once; it is mutated in place below.
+        info = state.guild_now_playing.setdefault(guild.id, {}) if guild else {}
+
         if voice.is_playing():
             voice.pause()
             # Track when we paused
-            if guild:
-                info = state.guild_now_playing.get(guild.id, {})
-                info["paused_at"] = time.time()
-                state.guild_now_playing[guild.id] = info
+            info["paused_at"] = time.time()
             await helpers.send_ephemeral_temporary(interaction, "Paused playback.")
         elif voice.is_paused():
             voice.resume()
             # Add paused duration to total and clear paused_at
-            if guild:
-                info = state.guild_now_playing.get(guild.id, {})
-                paused_at = info.get("paused_at")
-                if paused_at:
-                    paused_duration = time.time() - paused_at
-                    info["total_paused_time"] = info.get("total_paused_time", 0) + paused_duration
-                info["paused_at"] = None
-                state.guild_now_playing[guild.id] = info
+            paused_at = info.get("paused_at")
+            if paused_at:
+                info["total_paused_time"] = info.get("total_paused_time", 0) + (time.time() - paused_at)
+            info["paused_at"] = None
             await helpers.send_ephemeral_temporary(interaction, "Resumed playback.")
         else:
             await helpers.send_ephemeral_temporary(interaction, "Nothing is currently playing.")
@@ -730,8 +745,9 @@ class PlayerView(discord.ui.View):
             await helpers.send_ephemeral_temporary(interaction, "Previous song has no path to replay.")
             return
 
-        # Get stream URL for the previous song
-        stream_result = await helpers.get_api().stream_audio_file(path)
+        # Get stream URL for the previous song (short probe: a button click
+        # shouldn't hang on the session's 30 s timeout)
+        stream_result = await helpers.get_stream_result(path, timeout=5)
 
         if stream_result.get("status") != "success":
             await helpers.send_ephemeral_temporary(
@@ -815,18 +831,20 @@ class PlayerView(discord.ui.View):
             await helpers.send_ephemeral_temporary(interaction, "Not enough songs in queue to shuffle.")
             return
         
+        # Shuffle in place on the loop: playback pops from this same list,
+        # so it must not change between reading and writing the queue.
         random.shuffle(queue)
-        state.guild_queue[guild.id] = queue
         
         # Update the player embed to reflect the new queue order
         info = state.guild_now_playing.get(guild.id, {})
+        title, path, meta, _, duration = _unpack_np(info)
         await self._send_controls_fn(
             self.ctx,
-            title=info.get("title", "Unknown"),
-            path=info.get("path"),
+            title=title,
+            path=path,
             is_radio=self.is_radio,
-            metadata=info.get("metadata", {}),
-            duration_seconds=info.get("duration_seconds"),
+            metadata=meta,
+            duration_seconds=duration,
         )
         
         await helpers.send_ephemeral_temporary(interaction, f"🔀 Shuffled {len(queue)} tracks in queue.")
@@ -851,9 +869,7 @@ class PlayerView(discord.ui.View):
             )
             return
 
-        title = str(info.get("title", "Unknown"))
-        path = info.get("path")
-        meta = info.get("metadata") or {}
+        title, path, meta, is_radio, _ = _unpack_np(info)
 
         embed = discord.Embed(title="Now Playing", description=title)
 
@@ -862,162 +878,11 @@ class PlayerView(discord.ui.View):
         if image_url:
             embed.set_thumbnail(url=image_url)
 
-        # --- Identity / IDs ---
-        song_id_val = meta.get("id") or meta.get("song_id")
-        if song_id_val is not None:
-            embed.add_field(name="ID", value=str(song_id_val), inline=True)
-
-        if meta.get("public_id") is not None:
-            embed.add_field(name="Public ID", value=str(meta.get("public_id")), inline=True)
-
-        if meta.get("original_key"):
-            embed.add_field(name="Original Key", value=str(meta.get("original_key")), inline=True)
-
-        # --- Category / path ---
-        if meta.get("category"):
-            embed.add_field(name="Category", value=str(meta.get("category")), inline=True)
-
-        # Prefer the path from metadata; fall back to stored path.
-        full_path = meta.get("path") or path
-        if full_path:
-            embed.add_field(name="Path", value=f"`{full_path}`", inline=False)
-
-        # --- Era details ---
-        era_data = meta.get("era")
-        era_name = None
-        era_desc = None
-        era_time_frame = None
-        era_play_count = None
-
-        if isinstance(era_data, dict):
-            era_name = era_data.get("name")
-            era_desc = era_data.get("description")
-            era_time_frame = era_data.get("time_frame")
-            era_play_count = era_data.get("play_count")
-        elif era_data:
-            # Backwards-compat: older metadata stored era as a simple string.
-            era_name = str(era_data)
-
-        if any([era_name, era_desc, era_time_frame, era_play_count]):
-            lines: list[str] = []
-            if era_name:
-                lines.append(f"Name: {era_name}")
-            if era_desc:
-                lines.append(f"Description: {era_desc}")
-            if era_time_frame:
-                lines.append(f"Time frame: {era_time_frame}")
-            if era_play_count is not None:
-                lines.append(f"Play count: {era_play_count}")
-            embed.add_field(name="Era", value="\n".join(lines)[:1024], inline=False)
-
-        # --- Titles / tracking ---
-        track_titles = meta.get("track_titles") or []
-        if isinstance(track_titles, (list, tuple)) and track_titles:
-            embed.add_field(
-                name="Track titles",
-                value=", ".join(map(str, track_titles))[:1024],
-                inline=False,
-            )
-
-        if meta.get("session_titles") or meta.get("session_tracking"):
-            sess_lines = []
-            if meta.get("session_titles"):
-                sess_lines.append(f"Titles: {meta.get('session_titles')}")
-            if meta.get("session_tracking"):
-                sess_lines.append(f"Tracking: {meta.get('session_tracking')}")
-            embed.add_field(name="Sessions", value="\n".join(sess_lines)[:1024], inline=False)
-
-        # --- Credits ---
-        credits_lines = []
-        if meta.get("credited_artists"):
-            credits_lines.append(f"Artists: {meta.get('credited_artists')}")
-        if meta.get("producers"):
-            credits_lines.append(f"Producers: {meta.get('producers')}")
-        if meta.get("engineers"):
-            credits_lines.append(f"Engineers: {meta.get('engineers')}")
-        if credits_lines:
-            embed.add_field(
-                name="Credits",
-                value="\n".join(credits_lines)[:1024],
-                inline=False,
-            )
-
-        # --- Recording details ---
-        rec_lines = []
-        if meta.get("recording_locations"):
-            rec_lines.append(f"Locations: {meta.get('recording_locations')}")
-        if meta.get("record_dates"):
-            rec_lines.append(f"Record dates: {meta.get('record_dates')}")
-        if meta.get("dates"):
-            rec_lines.append(f"Additional dates: {meta.get('dates')}")
-        if rec_lines:
-            embed.add_field(
-                name="Recording",
-                value="\n".join(rec_lines)[:1024],
-                inline=False,
-            )
-
-        # --- Audio / technical ---
-        audio_lines = []
-        if meta.get("length"):
-            audio_lines.append(f"Length: {meta.get('length')}")
-        if meta.get("bitrate"):
-            audio_lines.append(f"Bitrate: {meta.get('bitrate')}")
-        if meta.get("instrumentals"):
-            audio_lines.append(f"Instrumentals: {meta.get('instrumentals')}")
-        if meta.get("instrumental_names"):
-            audio_lines.append(f"Instrumental names: {meta.get('instrumental_names')}")
-        if audio_lines:
-            embed.add_field(
-                name="Audio",
-                value="\n".join(audio_lines)[:1024],
-                inline=False,
-            )
-
-        # --- Files ---
-        if meta.get("file_names"):
-            embed.add_field(
-                name="File names",
-                value=str(meta.get("file_names"))[:1024],
-                inline=False,
-            )
-
-        # --- Release / leak info ---
-        release_lines = []
-        if meta.get("preview_date"):
-            release_lines.append(f"Preview date: {meta.get('preview_date')}")
-        if meta.get("release_date"):
-            release_lines.append(f"Release date: {meta.get('release_date')}")
-        if meta.get("date_leaked"):
-            release_lines.append(f"Leak date: {meta.get('date_leaked')}")
-        if meta.get("leak_type"):
-            release_lines.append(f"Leak type: {meta.get('leak_type')}")
-        if release_lines:
-            embed.add_field(
-                name="Release / Leak",
-                value="\n".join(release_lines)[:1024],
-                inline=False,
-            )
-
-        # --- Additional information ---
-        if meta.get("additional_information"):
-            embed.add_field(
-                name="Additional information",
-                value=str(meta.get("additional_information"))[:1024],
-                inline=False,
-            )
-
-        # --- Notes ---
-        if meta.get("notes"):
-            embed.add_field(
-                name="Notes",
-                value=str(meta.get("notes"))[:1024],
-                inline=False,
-            )
+        _add_song_detail_fields(embed, meta, path)
 
         # Radio mode indicator in the footer
         embed.set_footer(
-            text="Radio" if bool(info.get("is_radio")) else "On-demand playback"
+            text="Radio" if is_radio else "On-demand playback"
         )
 
         # Attach a temporary info view so the user can access lyrics/snippets
@@ -1057,37 +922,27 @@ class PlayerView(discord.ui.View):
         song_id_val = meta.get("id") or meta.get("song_id")
 
         user = interaction.user
-        playlists = state.get_or_create_user_playlists(user.id)
-        likes = playlists.setdefault("Likes", [])
+        like_ids, like_paths = state.playlist_index(user.id, "Likes")
 
         # Avoid duplicates: prefer matching by song ID, then by path.
-        already = False
-        for track in likes:
-            if song_id_val is not None and track.get("id") == song_id_val:
-                already = True
-                break
-            if path and track.get("path") == path:
-                already = True
-                break
-
-        if already:
+        if (song_id_val is not None and song_id_val in like_ids) or (path and path in like_paths):
             await helpers.send_ephemeral_temporary(
                 interaction, f"`{title}` is already in your Likes playlist."
             )
             return
 
-        likes.append(
+        state.append_playlist_track(
+            user.id,
+            "Likes",
             {
                 "id": song_id_val,
                 "name": title,
                 "path": path,
                 "metadata": meta,
                 "added_at": time.time(),
-            }
+            },
         )
 
-        state.save_user_playlists_to_disk()
-
         await helpers.send_ephemeral_temporary(
             interaction, f"Added `{title}` to your Likes playlist."
         )
@@ -1104,11 +959,7 @@ class PlayerView(discord.ui.View):
         playlists = state.user_playlists.get(user.id) or {}
 
         if not playlists:
-            await interaction.response.send_message(
-                "You don't have any playlists yet. Use ❤ Like on the player to "
-                "add the current song to your Likes playlist.",
-                ephemeral=True,
-            )
+            await interaction.response.send_message(NO_PLAYLISTS_MESSAGE, ephemeral=True)
             return
 
         view = PlaylistPaginationView(
@@ -1164,24 +1015,155 @@ class PlayerView(discord.ui.View):
 
         voice: Optional[discord.VoiceClient] = self.ctx.voice_client
         if voice and (voice.is_playing() or voice.is_paused()):
-            # Pre-fetch so "Up Next" is ready when the current song ends
-            await self._prefetch_fn(guild.id)
-            # Refresh the player embed to show radio state and up-next song
-            info = state.guild_now_playing.get(guild.id, {})
-            await self._send_controls_fn(
-                self.ctx,
-                title=info.get("title", "Unknown"),
-                path=info.get("path"),
-                is_radio=True,
-                metadata=info.get("metadata", {}),
-                duration_seconds=info.get("duration_seconds"),
-            )
+            # The next song is only needed when the current one ends, so
+            # prefetch it (and refresh "Up Next") after acknowledging.
+            helpers.spawn(self._prefetch_and_refresh(guild.id))
             await helpers.send_ephemeral_temporary(interaction, "Radio enabled. Current song will finish, then radio starts.")
         else:
             # Nothing playing; start radio immediately
             await self._radio_fn(self.ctx)
             await helpers.send_ephemeral_temporary(interaction, "Radio started.")
 
+    async def _prefetch_and_refresh(self, guild_id: int) -> None:
+        """Pre-fetch the next radio song, then redraw the player in radio mode."""
+        try:
+            await self._prefetch_fn(guild_id)
+        except Exception:
+            pass
+        if not state.guild_radio_enabled.get(guild_id):
+            return  # Radio was switched off while we were fetching.
+        info = state.guild_now_playing.get(guild_id, {})
+        title, path, meta, _, duration = _unpack_np(info)
+        await self._send_controls_fn(
+            self.ctx,
+            title=title,
+            path=path,
+            is_radio=True,
+            metadata=meta,
+            duration_seconds=duration,
+        )
+
+
+# ── Song detail fields ───────────────────────────────────────────────
+
+# Short inline fields shown under the ID: (metadata key, label).
+_NP_SIMPLE_FIELDS = (
+    ("public_id", "Public ID"),
+    ("original_key", "Original Key"),
+    ("category", "Category"),
+)
+
+# Lines of the Era field: (era key, label).
+_NP_ERA_FIELDS = (
+    ("name", "Name"),
+    ("description", "Description"),
+    ("time_frame", "Time frame"),
+    ("play_count", "Play count"),
+)
+
+# Full-width fields after the era block, in display order.  A bare key is
+# shown as-is; a tuple of (key, label) pairs becomes one "Label: value"
+# line per present key.
+_NP_GROUPS = (
+    ("Sessions", (("session_titles", "Titles"), ("session_tracking", "Tracking"))),
+    ("Credits", (
+        ("credited_artists", "Artists"),
+        ("producers", "Producers"),
+        ("engineers", "Engineers"),
+    )),
+    ("Recording", (
+        ("recording_locations", "Locations"),
+        ("record_dates", "Record dates"),
+        ("dates", "Additional dates"),
+    )),
+    ("Audio", (
+        ("length", "Length"),
+        ("bitrate", "Bitrate"),
+        ("instrumentals", "Instrumentals"),
+        ("instrumental_names", "Instrumental names"),
+    )),
+    ("File names", "file_names"),
+    ("Release / Leak", (
+        ("preview_date", "Preview date"),
+        ("release_date", "Release date"),
+        ("date_leaked", "Leak date"),
+        ("leak_type", "Leak type"),
+    )),
+    ("Additional information", "additional_information"),
+    ("Notes", "notes"),
+)
+
+
+def _clip(v: Any, n: int = 1024) -> str:
+    """Return *v* as a string of at most *n* chars (embed field value limit)."""
+    text = v if isinstance(v, str) else str(v)
+    return text if len(text) <= n else text[:n]
+
+
+@functools.lru_cache(maxsize=256)
+def _era_field_text(values: tuple) -> str:
+    """Format the Era field from values ordered as ``_NP_ERA_FIELDS``.
+
+    Memoized on the values themselves: there are only a handful of eras,
+    so every ℹ click after the first for an era is a cache hit.
+    """
+    if not any(values):
+        return ""
+    # Play count is shown even when 0; every other line needs a truthy value.
+    return _clip("\n".join(
+        f"{label}: {v}" for (key, label), v in zip(_NP_ERA_FIELDS, values)
+        if (v is not None if key == "play_count" else v)
+    ))
+
+
+def _add_song_detail_fields(
+    embed: discord.Embed, meta: Dict[str, Any], path: Optional[str]
+) -> None:
+    """Add the full song detail fields shared by the ℹ and Song Info embeds."""
+    get = meta.get  # bound once; called for every row below
+    song_id_val = get("id") or get("song_id")
+    if song_id_val is not None:
+        embed.add_field(name="ID", value=str(song_id_val), inline=True)
+
+    for key, label in _NP_SIMPLE_FIELDS:
+        v = get(key)
+        if v is not None and v != "":
+            embed.add_field(name=label, value=_clip(v), inline=True)
+
+    # Prefer the path from metadata; fall back to the stored path.
+    full_path = get("path") or path
+    if full_path:
+        embed.add_field(name="Path", value=f"`{full_path}`", inline=False)
+
+    era_data = get("era")
+    if era_data and not isinstance(era_data, dict):
+        # Backwards-compat: older metadata stored era as a simple string.
+        era_data = {"name": str(era_data)}
+    if era_data:
+        values = tuple(era_data.get(key) for key, _ in _NP_ERA_FIELDS)
+        try:
+            era_text = _era_field_text(values)
+        except TypeError:  # unhashable value; format without caching
+            era_text = _era_field_text.__wrapped__(values)
+        if era_text:
+            embed.add_field(name="Era", value=era_text, inline=False)
+
+    track_titles = get("track_titles") or []
+    if isinstance(track_titles, (list, tuple)) and track_titles:
+        embed.add_field(
+            name="Track titles",
+            value=_clip(", ".join(map(str, track_titles))),
+            inline=False,
+        )
+
+    for name, spec in _NP_GROUPS:
+        if isinstance(spec, str):
+            value = get(spec) or ""
+        else:
+            value = "\n".join(f"{label}: {v}" for key, label in spec if (v := get(key)))
+        if value:
+            embed.add_field(name=name, value=_clip(value), inline=False)
+
 
 def build_song_info_embed(song_obj: Any, *, path: Optional[str] = None) -> discord.Embed:
     """Build a rich song info embed from a song object — same layout as the player ℹ button.
@@ -1206,110 +1188,49 @@ def build_song_info_embed(song_obj: Any, *, path: Optional[str] = None) -> disco
     if image_url:
         embed.set_thumbnail(url=image_url)
 
-    song_id_val = meta.get("id") or meta.get("song_id")
-    if song_id_val is not None:
-        embed.add_field(name="ID", value=str(song_id_val), inline=True)
-    if meta.get("public_id") is not None:
-        embed.add_field(name="Public ID", value=str(meta.get("public_id")), inline=True)
-    if meta.get("original_key"):
-        embed.add_field(name="Original Key", value=str(meta.get("original_key")), inline=True)
-    if meta.get("category"):
-        embed.add_field(name="Category", value=str(meta.get("category")), inline=True)
-
-    full_path = meta.get("path") or path
-    if full_path:
-        embed.add_field(name="Path", value=f"`{full_path}`", inline=False)
-
-    era_data = meta.get("era")
-    era_name = era_desc = era_time_frame = era_play_count = None
-    if isinstance(era_data, dict):
-        era_name = era_data.get("name")
-        era_desc = era_data.get("description")
-        era_time_frame = era_data.get("time_frame")
-        era_play_count = era_data.get("play_count")
-    elif era_data:
-        era_name = str(era_data)
-    if any([era_name, era_desc, era_time_frame, era_play_count]):
-        lines: list[str] = []
-        if era_name:
-            lines.append(f"Name: {era_name}")
-        if era_desc:
-            lines.append(f"Description: {era_desc}")
-        if era_time_frame:
-            lines.append(f"Time frame: {era_time_frame}")
-        if era_play_count is not None:
-            lines.append(f"Play count: {era_play_count}")
-        embed.add_field(name="Era", value="\n".join(lines)[:1024], inline=False)
-
-    track_titles = meta.get("track_titles") or []
-    if isinstance(track_titles, (list, tuple)) and track_titles:
-        embed.add_field(name="Track titles", value=", ".join(map(str, track_titles))[:1024], inline=False)
-
-    if meta.get("session_titles") or meta.get("session_tracking"):
-        sess_lines = []
-        if meta.get("session_titles"):
-            sess_lines.append(f"Titles: {meta.get('session_titles')}")
-        if meta.get("session_tracking"):
-            sess_lines.append(f"Tracking: {meta.get('session_tracking')}")
-        embed.add_field(name="Sessions", value="\n".join(sess_lines)[:1024], inline=False)
-
-    credits_lines = []
-    if meta.get("credited_artists"):
-        credits_lines.append(f"Artists: {meta.get('credited_artists')}")
-    if meta.get("producers"):
-        credits_lines.append(f"Producers: {meta.get('producers')}")
-    if meta.get("engineers"):
-        credits_lines.append(f"Engineers: {meta.get('engineers')}")
-    if credits_lines:
-        embed.add_field(name="Credits", value="\n".join(credits_lines)[:1024], inline=False)
-
-    rec_lines = []
-    if meta.get("recording_locations"):
-        rec_lines.append(f"Locations: {meta.get('recording_locations')}")
-    if meta.get("record_dates"):
-        rec_lines.append(f"Record dates: {meta.get('record_dates')}")
-    if meta.get("dates"):
-        rec_lines.append(f"Additional dates: {meta.get('dates')}")
-    if rec_lines:
-        embed.add_field(name="Recording", value="\n".join(rec_lines)[:1024], inline=False)
-
-    audio_lines = []
-    if meta.get("length"):
-        audio_lines.append(f"Length: {meta.get('length')}")
-    if meta.get("bitrate"):
-        audio_lines.append(f"Bitrate: {meta.get('bitrate')}")
-    if meta.get("instrumentals"):
-        audio_lines.append(f"Instrumentals: {meta.get('instrumentals')}")
-    if meta.get("instrumental_names"):
-        audio_lines.append(f"Instrumental names: {meta.get('instrumental_names')}")
-    if audio_lines:
-        embed.add_field(name="Audio", value="\n".join(audio_lines)[:1024], inline=False)
-
-    if meta.get("file_names"):
-        embed.add_field(name="File names", value=str(meta.get("file_names"))[:1024], inline=False)
-
-    release_lines = []
-    if meta.get("preview_date"):
-        release_lines.append(f"Preview date: {meta.get('preview_date')}")
-    if meta.get("release_date"):
-        release_lines.append(f"Release date: {meta.get('release_date')}")
-    if meta.get("date_leaked"):
-        release_lines.append(f"Leak date: {meta.get('date_leaked')}")
-    if meta.get("leak_type"):
-        release_lines.append(f"Leak type: {meta.get('leak_type')}")
-    if release_lines:
-        embed.add_field(name="Release / Leak", value="\n".join(release_lines)[:1024], inline=False)
-
-    if meta.get("additional_information"):
-        embed.add_field(name="Additional information", value=str(meta.get("additional_information"))[:1024], inline=False)
-
-    if meta.get("notes"):
-        embed.add_field(name="Notes", value=str(meta.get("notes"))[:1024], inline=False)
+    _add_song_detail_fields(embed, meta, path)
 
     embed.set_footer(text="Press Back to return.")
     return embed
 
 
+# The player refreshes every 5s, so the progress bar is drawn in 5s steps.
+_PROGRESS_STEP = 5
+
+
+@functools.lru_cache(maxsize=1024)
+def _progress_glyphs_cached(bucket: int, duration: int) -> str:
+    return helpers.progress_bar_glyphs(bucket * _PROGRESS_STEP, duration)
+
+
+def _elapsed_seconds(
+    started_at: Optional[float],
+    paused_at: Optional[float],
+    total_paused_time: float = 0,
+) -> Optional[int]:
+    """Return whole seconds played so far, excluding paused time."""
+    if not started_at:
+        return None
+    # If currently paused, don't count time since pause started
+    raw_elapsed = (paused_at or time.time()) - started_at
+    # Subtract total time spent paused; never go negative
+    return max(0, int(raw_elapsed - total_paused_time))
+
+
+def progress_bucket(
+    started_at: Optional[float],
+    paused_at: Optional[float],
+    total_paused_time: float = 0,
+) -> Optional[int]:
+    """Return the progress-bar step for the current playback position.
+
+    Two renders with the same step (and pause state) draw the same bar,
+    which lets the refresh loop skip redundant edits.
+    """
+    elapsed = _elapsed_seconds(started_at, paused_at, total_paused_time)
+    return None if elapsed is None else elapsed // _PROGRESS_STEP
+
+
 def build_player_embed(
     guild_id: int,
     *,
@@ -1336,8 +1257,9 @@ def build_player_embed(
         embed.set_thumbnail(url=image_url)
 
     # Minimal song details for the main player: category & era only
-    if meta.get("category"):
-        embed.add_field(name="Category", value=str(meta.get("category")), inline=True)
+    category = meta.get("category")
+    if category:
+        embed.add_field(name="Category", value=str(category), inline=True)
 
     era_val = meta.get("era")
     if era_val is not None:
@@ -1351,17 +1273,14 @@ def build_player_embed(
             embed.add_field(name="Era", value=era_text, inline=True)
 
     # Duration + progress bar (accounting for pause time)
-    if duration_seconds and started_at:
-        now = time.time()
-        # If currently paused, don't count time since pause started
-        if paused_at:
-            raw_elapsed = paused_at - started_at
-        else:
-            raw_elapsed = now - started_at
-        # Subtract total time spent paused
-        elapsed = int(raw_elapsed - total_paused_time)
-        elapsed = max(0, elapsed)  # Ensure non-negative
-        progress = helpers.format_progress_bar(elapsed, duration_seconds)
+    elapsed = _elapsed_seconds(started_at, paused_at, total_paused_time)
+    if duration_seconds and elapsed is not None:
+        # Only the bar glyphs are cached per step; the time is exact.
+        progress = helpers.format_progress_bar(
+            elapsed,
+            duration_seconds,
+            bar=_progress_glyphs_cached(elapsed // _PROGRESS_STEP, duration_seconds),
+        )
         # Add paused indicator if currently paused
         if paused_at:
             progress = "⏸️ " + progress
@@ -1374,16 +1293,14 @@ def build_player_embed(
         embed.add_field(name="Previous", value=f"**{prev_title}**", inline=True)
 
     # Queue count with next song name (Up Next)
-    queue = state.guild_queue.get(guild_id, [])
-    if queue:
-        next_title = queue[0].get("title", "Unknown")
-        queue_text = f"{len(queue)} track(s)\nUp Next: **{next_title}**"
-        embed.add_field(name="Queue", value=queue_text, inline=True)
-    elif is_radio:
-        # Show pre-fetched radio next song if available
-        radio_next = state.guild_radio_next.get(guild_id)
-        if radio_next:
-            next_title = radio_next.get("title", "Unknown")
+    # (or the pre-fetched radio song when the queue is empty)
+    queue = state.guild_queue.get(guild_id)
+    upcoming = queue[0] if queue else (state.guild_radio_next.get(guild_id) if is_radio else None)
+    if upcoming:
+        next_title = upcoming.get("title", "Unknown")
+        if queue:
+            embed.add_field(name="Queue", value=f"{len(queue)} track(s)\nUp Next: **{next_title}**", inline=True)
+        else:
             embed.add_field(name="Up Next", value=f"**{next_title}**", inline=True)
 
     # Radio mode indicator only in the footer
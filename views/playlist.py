@@ -1,11 +1,11 @@
 """Playlist-related UI views for the Juice WRLD Discord bot."""
 
 import asyncio
-import io
-import math
+import functools
 import os
 import random
 import sys
+import tempfile
 import time
 from typing import Any, Callable, Dict, List, Optional
 
@@ -16,6 +16,33 @@ from discord.ext import commands
 import helpers
 import state
 
+
+def _ceil_div(n: int, d: int) -> int:
+    """Integer ceiling division (page counts without a float round-trip)."""
+    return -(-n // d)
+
+
+# ZIPs larger than this are spooled to disk rather than kept in memory.
+ZIP_SPOOL_MAX_BYTES = 32 * 1024 * 1024
+
+
+async def _fetch_zip_spool(file_paths: List[str]) -> "tempfile.SpooledTemporaryFile[bytes]":
+    """Stream a ZIP of *file_paths* into a spooled temp file for upload.
+
+    Chunks go straight from the API response into the spool, so the full
+    archive is never materialised as ``bytes``.  The caller must close the
+    returned file: ``discord.File`` never closes a file object it is given.
+    """
+    buf = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_BYTES)
+    try:
+        await helpers.get_api().create_zip_into(file_paths, buf)
+    except BaseException:
+        buf.close()
+        raise
+    buf.seek(0)
+    return buf
+
+
 class PlaylistPaginationView(discord.ui.View):
     """Paginated playlists with menu-first UI.
     
@@ -52,7 +79,6 @@ class PlaylistPaginationView(discord.ui.View):
         self.playlist_items: List[tuple] = list(playlists.items())
         self.per_page = 5
         self.current_page = 0
-        self.total_pages = max(1, math.ceil(len(self.playlist_items) / self.per_page))
         self._rebuild_buttons()
 
     async def on_timeout(self) -> None:
@@ -65,6 +91,22 @@ class PlaylistPaginationView(discord.ui.View):
             except Exception:
                 pass  # Ignore other errors during cleanup
 
+    def _find_item(self, name: str) -> int:
+        """Return the index of playlist *name* in ``playlist_items`` (or -1)."""
+        for idx, (item_name, _) in enumerate(self.playlist_items):
+            if item_name == name:
+                return idx
+        return -1
+
+    @property
+    def total_pages(self) -> int:
+        return max(1, _ceil_div(len(self.playlist_items), self.per_page))
+
+    def _clamp_page(self) -> None:
+        """Keep ``current_page`` in range after ``playlist_items`` shrank."""
+        if self.current_page >= self.total_pages:
+            self.current_page = self.total_pages - 1
+
     def _get_page_playlists(self) -> List[tuple]:
         start = self.current_page * self.per_page
         end = start + self.per_page
@@ -190,12 +232,12 @@ class PlaylistPaginationView(discord.ui.View):
             # Row 0: pagination (only show if navigable)
             if self.current_page > 0:
                 prev_btn = discord.ui.Button(label="◀", style=discord.ButtonStyle.secondary, row=0)
-                prev_btn.callback = lambda i: self._change_page(i, -1)
+                prev_btn.callback = self._prev_page
                 self.add_item(prev_btn)
             
             if self.current_page < self.total_pages - 1:
                 next_btn = discord.ui.Button(label="▶", style=discord.ButtonStyle.secondary, row=0)
-                next_btn.callback = lambda i: self._change_page(i, +1)
+                next_btn.callback = self._next_page
                 self.add_item(next_btn)
             
             back_btn = discord.ui.Button(label="⬅ Back", style=discord.ButtonStyle.danger, row=0)
@@ -358,6 +400,12 @@ class PlaylistPaginationView(discord.ui.View):
         embed = self.build_embed()
         await interaction.response.edit_message(embed=embed, view=self)
 
+    async def _prev_page(self, interaction: discord.Interaction) -> None:
+        await self._change_page(interaction, -1)
+
+    async def _next_page(self, interaction: discord.Interaction) -> None:
+        await self._change_page(interaction, +1)
+
     async def _change_page(self, interaction: discord.Interaction, delta: int) -> None:
         new_page = self.current_page + delta
         if new_page < 0 or new_page >= self.total_pages:
@@ -416,7 +464,7 @@ class PlaylistPaginationView(discord.ui.View):
                 continue
 
             try:
-                result = await helpers.get_api().stream_audio_file(file_path)
+                result = await helpers.get_stream_result(file_path)
 
                 if result.get("status") != "success":
                     errors += 1
@@ -517,7 +565,7 @@ class PlaylistPaginationView(discord.ui.View):
             msg = await interaction.followup.send(
                 f"Playlist `{target_playlist_name}` not found.", ephemeral=True, wait=True
             )
-            asyncio.create_task(helpers.delete_later(msg, 5))
+            helpers.schedule_message_deletion(msg, 5)
             return
 
         # Avoid duplicates: prefer matching by song ID, then by path.
@@ -534,7 +582,7 @@ class PlaylistPaginationView(discord.ui.View):
             msg = await interaction.followup.send(
                 f"`{title}` is already in playlist `{target_playlist_name}`.", ephemeral=True, wait=True
             )
-            asyncio.create_task(helpers.delete_later(msg, 5))
+            helpers.schedule_message_deletion(msg, 5)
             return
 
         playlist.append(
@@ -547,7 +595,7 @@ class PlaylistPaginationView(discord.ui.View):
             }
         )
 
-        state.save_user_playlists_to_disk()
+        state.schedule_playlists_save()
 
         msg = await interaction.followup.send(
             f"Added `{title}` to playlist `{target_playlist_name}`.", ephemeral=True, wait=True
@@ -561,7 +609,7 @@ class PlaylistPaginationView(discord.ui.View):
             pass
         
         # Schedule deletion of confirmation message after 5 seconds
-        asyncio.create_task(helpers.delete_later(msg, 5))
+        helpers.schedule_message_deletion(msg, 5)
 
     async def _handle_rename_playlist(self, interaction: discord.Interaction, slot_index: int) -> None:
         """Handle renaming a playlist."""
@@ -593,13 +641,11 @@ class PlaylistPaginationView(discord.ui.View):
             del playlists[playlist_name]
             if not playlists:
                 state.user_playlists.pop(user.id, None)
-            state.save_user_playlists_to_disk()
+            state.schedule_playlists_save()
         
-        # Refresh playlist items
-        self.playlist_items = list(playlists.items())
-        self.total_pages = max(1, math.ceil(len(self.playlist_items) / self.per_page))
-        if self.current_page >= self.total_pages:
-            self.current_page = max(0, self.total_pages - 1)
+        # Drop the item in place rather than rebuilding the list
+        del self.playlist_items[global_index]
+        self._clamp_page()
         
         # Go back to menu if no playlists left
         if not playlists:
@@ -692,25 +738,13 @@ class PlaylistPaginationView(discord.ui.View):
 
         try:
             # Use the API to create a ZIP file
-            zip_content = await helpers.get_api().create_zip(file_paths)
-
-            # Send the ZIP file to the user
-            zip_file = discord.File(
-                io.BytesIO(zip_content),
-                filename=f"{playlist_name}.zip"
-            )
-            
-            await interaction.followup.send(
-                f"Here's your playlist **{playlist_name}** ({len(file_paths)} file(s)):",
-                file=zip_file,
-                ephemeral=True,
-            )
-            
-            # Delete the status message
-            try:
-                await status_msg.delete()
-            except Exception:
-                pass
+            # Swap the status message for the ZIP (one request, not send + delete)
+            with await _fetch_zip_spool(file_paths) as buf:
+                await status_msg.edit(
+                    content=f"Here's your playlist **{playlist_name}** ({len(file_paths)} file(s)):",
+                    embed=None,
+                    attachments=[discord.File(buf, filename=f"{playlist_name}.zip")],
+                )
         except Exception as e:
             # Update status message to show error
             error_embed = discord.Embed(
@@ -792,10 +826,24 @@ class SharedPlaylistView(discord.ui.View):
         self._queue_fn = queue_fn  # PlaybackCog._queue_or_play_now injected by caller
         self.per_page = 10
         self.current_page = 0
-        self.total_pages = max(1, math.ceil(len(self.tracks) / self.per_page))
+        self.total_pages = max(1, _ceil_div(len(self.tracks), self.per_page))
         self.message: Optional[discord.Message] = None
+        # Rendered track lines keyed by (page, id(tracks), len(tracks)).
+        self._embed_cache: Dict[tuple, str] = {}
         self._rebuild_buttons()
 
+    def _page_lines(self) -> str:
+        """Return the current page's track list, rendering it only once."""
+        key = (self.current_page, id(self.tracks), len(self.tracks))
+        text = self._embed_cache.get(key)
+        if text is None:
+            lines: List[str] = []
+            for idx, track in enumerate(self._page_tracks, start=self._page_start + 1):
+                name = track.get("name") or track.get("id") or "Unknown"
+                lines.append(f"`{idx}.` {name}")
+            text = self._embed_cache[key] = "\n".join(lines)
+        return text
+
     def build_embed(self) -> discord.Embed:
         total = len(self.tracks)
         owner_name = getattr(self.owner, 'display_name', str(self.owner))
@@ -805,19 +853,10 @@ class SharedPlaylistView(discord.ui.View):
         if total == 0:
             description = header + "\n\n(empty playlist)"
         else:
-            start = self.current_page * self.per_page
-            end = start + self.per_page
-            page_tracks = self.tracks[start:end]
-            
-            lines: List[str] = []
-            for idx, track in enumerate(page_tracks, start=start + 1):
-                name = track.get("name") or track.get("id") or "Unknown"
-                lines.append(f"`{idx}.` {name}")
-            
             description = header
             if self.total_pages > 1:
                 description += f"\nPage {self.current_page + 1}/{self.total_pages}"
-            description += "\n\n" + "\n".join(lines)
+            description += "\n\n" + self._page_lines()
 
         embed = discord.Embed(
             title="🎵 Shared Playlist",
@@ -827,8 +866,14 @@ class SharedPlaylistView(discord.ui.View):
         embed.set_footer(text="Use the buttons below to interact with this playlist.")
         return embed
 
+    def _slice_page(self) -> None:
+        """Cache the current page's slice for build_embed and the buttons."""
+        self._page_start = self.current_page * self.per_page
+        self._page_tracks = self.tracks[self._page_start:self._page_start + self.per_page]
+
     def _rebuild_buttons(self) -> None:
         self.clear_items()
+        self._slice_page()
         
         # Row 0: Navigation
         prev_btn = discord.ui.Button(
@@ -837,8 +882,9 @@ class SharedPlaylistView(discord.ui.View):
             row=0, 
             disabled=self.current_page == 0
         )
-        prev_btn.callback = lambda i: self._change_page(i, -1)
+        prev_btn.callback = self._prev_page
         self.add_item(prev_btn)
+        self._prev_btn = prev_btn
         
         next_btn = discord.ui.Button(
             label="▶", 
@@ -846,8 +892,9 @@ class SharedPlaylistView(discord.ui.View):
             row=0, 
             disabled=self.current_page >= self.total_pages - 1
         )
-        next_btn.callback = lambda i: self._change_page(i, +1)
+        next_btn.callback = self._next_page
         self.add_item(next_btn)
+        self._next_btn = next_btn
         
         # Row 1: Action buttons
         queue_btn = discord.ui.Button(
@@ -874,13 +921,25 @@ class SharedPlaylistView(discord.ui.View):
         download_btn.callback = self._on_download
         self.add_item(download_btn)
 
+    def _sync_page_buttons(self) -> None:
+        """Re-slice the page and flip nav button states in place."""
+        self._slice_page()
+        self._prev_btn.disabled = self.current_page == 0
+        self._next_btn.disabled = self.current_page >= self.total_pages - 1
+
+    async def _prev_page(self, interaction: discord.Interaction) -> None:
+        await self._change_page(interaction, -1)
+
+    async def _next_page(self, interaction: discord.Interaction) -> None:
+        await self._change_page(interaction, +1)
+
     async def _change_page(self, interaction: discord.Interaction, delta: int) -> None:
         new_page = self.current_page + delta
         if new_page < 0 or new_page >= self.total_pages:
             await interaction.response.defer()
             return
         self.current_page = new_page
-        self._rebuild_buttons()
+        self._sync_page_buttons()
         embed = self.build_embed()
         await interaction.response.edit_message(embed=embed, view=self)
 
@@ -907,15 +966,30 @@ class SharedPlaylistView(discord.ui.View):
         if self.ctx.guild:
             state.guild_radio_enabled[self.ctx.guild.id] = False
 
-        voice = await helpers.ensure_voice_connected(self.ctx.guild, user)
+        guild = self.ctx.guild
+        current = guild.voice_client if guild else None
+        was_connected = bool(current and current.is_connected())
+
+        # Join voice while every stream URL resolves, then queue in order.
+        playable = [t for t in self.tracks if t.get("path")]
+        voice, results = await asyncio.gather(
+            helpers.ensure_voice_connected(guild, user),
+            helpers.resolve_stream_urls([t["path"] for t in playable]),
+        )
 
-        queued = 0
-        for track in self.tracks:
-            file_path = track.get("path")
-            if not file_path:
-                continue
+        # Nothing playable: don't leave the bot sitting in a channel we just joined.
+        if not any(r.get("status") == "success" and r.get("stream_url") for r in results):
+            if voice and not was_connected:
+                await voice.disconnect()
+            await interaction.followup.send(
+                "Could not queue any tracks from this playlist.",
+                ephemeral=True,
+            )
+            return
 
-            result = await helpers.get_api().stream_audio_file(file_path)
+        queued = 0
+        for track, result in zip(playable, results):
+            file_path = track["path"]
 
             if result.get("status") != "success":
                 continue
@@ -953,7 +1027,7 @@ class SharedPlaylistView(discord.ui.View):
                 wait=True,
             )
             # Auto-delete the queue confirmation after 5 seconds
-            asyncio.create_task(helpers.delete_later(queue_msg, 5))
+            helpers.schedule_message_deletion(queue_msg, 5)
             # Delete the shared playlist message after 120 seconds (only on success)
             await self._schedule_message_deletion()
 
@@ -963,26 +1037,17 @@ class SharedPlaylistView(discord.ui.View):
         user_playlists = state.get_or_create_user_playlists(user.id)
         
         # Generate a unique name if there's a conflict
-        base_name = self.playlist_name
-        new_name = base_name
-        counter = 1
-        while new_name in user_playlists:
-            new_name = f"{base_name} ({counter})"
-            counter += 1
+        new_name = helpers.unique_playlist_name(self.playlist_name, user_playlists)
         
-        # Deep copy the tracks
-        copied_tracks = []
-        for track in self.tracks:
-            copied_tracks.append({
-                "id": track.get("id"),
-                "name": track.get("name"),
-                "path": track.get("path"),
-                "metadata": track.get("metadata", {}),
-                "added_at": time.time(),
-            })
+        # Copy the tracks (metadata too, so the two playlists don't alias)
+        now = time.time()
+        copied_tracks = [
+            {**t, "metadata": dict(t.get("metadata") or {}), "added_at": now}
+            for t in self.tracks
+        ]
         
         user_playlists[new_name] = copied_tracks
-        state.save_user_playlists_to_disk()
+        state.schedule_playlists_save()
         
         await interaction.response.send_message(
             f"📋 Copied **{self.playlist_name}** to your playlists as **{new_name}** ({len(copied_tracks)} track(s)).",
@@ -1030,23 +1095,12 @@ class SharedPlaylistView(discord.ui.View):
         )
 
         try:
-            zip_content = await helpers.get_api().create_zip(file_paths)
-
-            zip_file = discord.File(
-                io.BytesIO(zip_content),
-                filename=f"{self.playlist_name}.zip"
-            )
-            
-            await interaction.followup.send(
-                f"Here's **{self.playlist_name}** ({len(file_paths)} file(s)):",
-                file=zip_file,
-                ephemeral=True,
-            )
-            
-            try:
-                await status_msg.delete()
-            except Exception:
-                pass
+            with await _fetch_zip_spool(file_paths) as buf:
+                await status_msg.edit(
+                    content=f"Here's **{self.playlist_name}** ({len(file_paths)} file(s)):",
+                    embed=None,
+                    attachments=[discord.File(buf, filename=f"{self.playlist_name}.zip")],
+                )
         except Exception as e:
             error_embed = discord.Embed(
                 title="❌ Error",
@@ -1067,7 +1121,7 @@ class SharedPlaylistView(discord.ui.View):
     async def _schedule_message_deletion(self) -> None:
         """Schedule the shared playlist message to be deleted after 120 seconds."""
         if self.message:
-            asyncio.create_task(helpers.delete_later(self.message, 120))
+            helpers.schedule_message_deletion(self.message, 120)
             self.stop()  # Stop the view to prevent further interactions
 
     async def on_timeout(self) -> None:
@@ -1101,9 +1155,22 @@ class PlaylistEditOptionsView(discord.ui.View):
         self.parent_view = parent_view
         self.current_page = 0
         self.per_page = 5
-        self.total_pages = max(1, math.ceil(len(self.tracks) / self.per_page))
+        # Rendered track lines keyed by (page, id(tracks), len(tracks)).
+        self._embed_cache: Dict[tuple, str] = {}
         self._rebuild_buttons()
 
+    def _page_lines(self) -> str:
+        """Return the current page's track list, rendering it only once."""
+        key = (self.current_page, id(self.tracks), len(self.tracks))
+        text = self._embed_cache.get(key)
+        if text is None:
+            lines: List[str] = []
+            for idx, track in enumerate(self._page_tracks, start=self._page_start + 1):
+                name = track.get("name") or track.get("id") or "Unknown"
+                lines.append(f"**{idx}.** {name}")
+            text = self._embed_cache[key] = "\n".join(lines)
+        return text
+
     def build_embed(self) -> discord.Embed:
         total = len(self.tracks)
         header = f"Editing: **{self.playlist_name}** ({total} track(s))"
@@ -1111,19 +1178,10 @@ class PlaylistEditOptionsView(discord.ui.View):
         if total == 0:
             description = header + "\n\n(empty playlist)"
         else:
-            start = self.current_page * self.per_page
-            end = start + self.per_page
-            page_tracks = self.tracks[start:end]
-            
-            lines: List[str] = []
-            for idx, track in enumerate(page_tracks, start=start + 1):
-                name = track.get("name") or track.get("id") or "Unknown"
-                lines.append(f"**{idx}.** {name}")
-            
             description = header
             if self.total_pages > 1:
                 description += f"\nPage {self.current_page + 1}/{self.total_pages}"
-            description += "\n\n" + "\n".join(lines)
+            description += "\n\n" + self._page_lines()
 
         embed = discord.Embed(
             title=f"Edit Playlist",
@@ -1132,9 +1190,19 @@ class PlaylistEditOptionsView(discord.ui.View):
         embed.set_footer(text="🗑️1-5 removes that track. Use Rename/Delete for playlist actions.")
         return embed
 
+    def _slice_page(self) -> None:
+        """Cache the current page's slice for build_embed and the buttons."""
+        self._page_start = self.current_page * self.per_page
+        self._page_tracks = self.tracks[self._page_start:self._page_start + self.per_page]
+
+    @property
+    def total_pages(self) -> int:
+        return max(1, _ceil_div(len(self.tracks), self.per_page))
+
     def _rebuild_buttons(self) -> None:
         self.clear_items()
-        total = len(self.tracks)
+        self._slice_page()
+        page_count = len(self._page_tracks)
         
         # Row 0: Back, Rename, Delete playlist
         back_btn = discord.ui.Button(label="⬅ Back", style=discord.ButtonStyle.secondary, row=0)
@@ -1152,26 +1220,39 @@ class PlaylistEditOptionsView(discord.ui.View):
         # Row 1: Pagination if needed
         if self.total_pages > 1:
             prev_btn = discord.ui.Button(label="◀", style=discord.ButtonStyle.secondary, row=1, disabled=self.current_page == 0)
-            prev_btn.callback = lambda i: self._change_page(i, -1)
+            prev_btn.callback = self._prev_page
             self.add_item(prev_btn)
+            self._prev_btn = prev_btn
             
             next_btn = discord.ui.Button(label="▶", style=discord.ButtonStyle.secondary, row=1, disabled=self.current_page >= self.total_pages - 1)
-            next_btn.callback = lambda i: self._change_page(i, +1)
+            next_btn.callback = self._next_page
             self.add_item(next_btn)
+            self._next_btn = next_btn
         
         # Row 2: Remove track buttons (🗑️1-5)
+        self._remove_btns: List[discord.ui.Button] = []
         for slot in range(5):
-            global_index = self.current_page * self.per_page + slot
-            disabled = global_index >= total
+            disabled = slot >= page_count
             
             btn = discord.ui.Button(label=f"🗑️{slot + 1}", style=discord.ButtonStyle.danger, row=2, disabled=disabled)
-            btn.callback = self._make_remove_callback(slot)
+            btn.callback = functools.partial(self._handle_remove_track, slot_index=slot)
             self.add_item(btn)
+            self._remove_btns.append(btn)
 
-    def _make_remove_callback(self, slot_index: int):
-        async def callback(interaction: discord.Interaction):
-            await self._handle_remove_track(interaction, slot_index)
-        return callback
+    def _sync_page_buttons(self) -> None:
+        """Re-slice the page and flip nav/remove button states in place."""
+        self._slice_page()
+        self._prev_btn.disabled = self.current_page == 0
+        self._next_btn.disabled = self.current_page >= self.total_pages - 1
+        page_count = len(self._page_tracks)
+        for slot, btn in enumerate(self._remove_btns):
+            btn.disabled = slot >= page_count
+
+    async def _prev_page(self, interaction: discord.Interaction) -> None:
+        await self._change_page(interaction, -1)
+
+    async def _next_page(self, interaction: discord.Interaction) -> None:
+        await self._change_page(interaction, +1)
 
     async def _change_page(self, interaction: discord.Interaction, delta: int) -> None:
         new_page = self.current_page + delta
@@ -1179,15 +1260,13 @@ class PlaylistEditOptionsView(discord.ui.View):
             await interaction.response.defer()
             return
         self.current_page = new_page
-        self._rebuild_buttons()
+        self._sync_page_buttons()
         embed = self.build_embed()
         await interaction.response.edit_message(embed=embed, view=self)
 
     async def _on_back(self, interaction: discord.Interaction) -> None:
-        # Refresh the parent view's playlist data and go back
-        user_playlists = state.user_playlists.get(self.user.id) or {}
-        self.parent_view.playlist_items = list(user_playlists.items())
-        self.parent_view.total_pages = max(1, math.ceil(len(self.parent_view.playlist_items) / self.parent_view.per_page))
+        # Track edits mutate the shared list and renames are spliced into
+        # the parent already, so its items are current; just go back.
         self.parent_view.mode = "menu"
         self.parent_view._rebuild_buttons()
         embed = self.parent_view.build_embed()
@@ -1206,16 +1285,17 @@ class PlaylistEditOptionsView(discord.ui.View):
             del playlists[self.playlist_name]
             if not playlists:
                 state.user_playlists.pop(user.id, None)
-            state.save_user_playlists_to_disk()
+            state.schedule_playlists_save()
         
-        # Go back to parent view with refreshed data
-        user_playlists = state.user_playlists.get(user.id) or {}
-        self.parent_view.playlist_items = list(user_playlists.items())
-        self.parent_view.total_pages = max(1, math.ceil(len(self.parent_view.playlist_items) / self.parent_view.per_page))
+        # Go back to parent view with the deleted item dropped
+        idx = self.parent_view._find_item(self.playlist_name)
+        if idx >= 0:
+            del self.parent_view.playlist_items[idx]
+        self.parent_view._clamp_page()
         self.parent_view.mode = "menu"
         self.parent_view._rebuild_buttons()
         
-        if not user_playlists:
+        if not playlists:
             embed = discord.Embed(
                 title="Playlists",
                 description="You don't have any playlists yet.",
@@ -1226,7 +1306,7 @@ class PlaylistEditOptionsView(discord.ui.View):
             await interaction.response.edit_message(embed=embed, view=self.parent_view)
 
     async def _handle_remove_track(self, interaction: discord.Interaction, slot_index: int) -> None:
-        global_index = self.current_page * self.per_page + slot_index
+        global_index = self._page_start + slot_index
         if global_index < 0 or global_index >= len(self.tracks):
             await interaction.response.send_message("No track in that position.", ephemeral=True)
             return
@@ -1241,12 +1321,11 @@ class PlaylistEditOptionsView(discord.ui.View):
         
         removed_track = playlist.pop(global_index)
         self.tracks = playlist  # Update local reference
-        state.save_user_playlists_to_disk()
+        self._embed_cache.clear()
+        state.schedule_playlists_save()
         
-        # Recalculate pages
-        self.total_pages = max(1, math.ceil(len(self.tracks) / self.per_page))
         if self.current_page >= self.total_pages:
-            self.current_page = max(0, self.total_pages - 1)
+            self.current_page = self.total_pages - 1
         
         self._rebuild_buttons()
         embed = self.build_embed()
@@ -1285,19 +1364,27 @@ class PlaylistRenameModal(discord.ui.Modal, title="Rename Playlist"):
             await interaction.response.send_message(f"A playlist named `{new_name}` already exists.", ephemeral=True)
             return
         
-        if old_name in playlists:
-            playlists[new_name] = playlists.pop(old_name)
-            state.save_user_playlists_to_disk()
+        await interaction.response.defer()
+        tracks = playlists.pop(old_name, None)
+        if tracks is not None:
+            playlists[new_name] = tracks
+            state.schedule_playlists_save()
         
-        # Update the edit view
+        # Update the edit view (same list object, only the name changed)
         self.edit_view.playlist_name = new_name
-        self.edit_view.tracks = playlists.get(new_name, [])
+        if tracks is not None:
+            self.edit_view.tracks = tracks
+        self.edit_view._embed_cache.clear()
+        self.edit_view._slice_page()
         
-        # Also update parent view's playlist items
-        self.edit_view.parent_view.playlist_items = list(playlists.items())
+        # Also rename the entry in the parent view's playlist items
+        parent = self.edit_view.parent_view
+        idx = parent._find_item(old_name)
+        if idx >= 0:
+            parent.playlist_items[idx] = (new_name, self.edit_view.tracks)
         
         embed = self.edit_view.build_embed()
-        await interaction.response.edit_message(embed=embed, view=self.edit_view)
+        await interaction.edit_original_response(embed=embed, view=self.edit_view)
 
 
 class PlaylistCreateModal(discord.ui.Modal, title="Create New Playlist"):
@@ -1328,17 +1415,17 @@ class PlaylistCreateModal(discord.ui.Modal, title="Create New Playlist"):
             )
             return
         
+        await interaction.response.defer()
         playlists[name] = []
-        state.save_user_playlists_to_disk()
+        state.schedule_playlists_save()
         
         # Refresh the view
-        self.pagination_view.playlist_items = list(playlists.items())
-        self.pagination_view.total_pages = max(1, math.ceil(len(self.pagination_view.playlist_items) / self.pagination_view.per_page))
+        self.pagination_view.playlist_items.append((name, playlists[name]))
         self.pagination_view.mode = "menu"
         self.pagination_view._rebuild_buttons()
         
         embed = self.pagination_view.build_embed()
-        await interaction.response.edit_message(embed=embed, view=self.pagination_view)
+        await interaction.edit_original_response(embed=embed, view=self.pagination_view)
 
 
 class PlaylistRenameModalNew(discord.ui.Modal, title="Rename Playlist"):
@@ -1373,17 +1460,22 @@ class PlaylistRenameModalNew(discord.ui.Modal, title="Rename Playlist"):
             await interaction.response.send_message(f"A playlist named `{new_name}` already exists.", ephemeral=True)
             return
         
-        if self.old_name in playlists:
-            playlists[new_name] = playlists.pop(self.old_name)
-            state.save_user_playlists_to_disk()
+        await interaction.response.defer()
+        tracks = playlists.pop(self.old_name, None)
+        if tracks is not None:
+            playlists[new_name] = tracks
+            state.schedule_playlists_save()
         
-        # Refresh the view
-        self.pagination_view.playlist_items = list(playlists.items())
-        self.pagination_view.total_pages = max(1, math.ceil(len(self.pagination_view.playlist_items) / self.pagination_view.per_page))
+        # Splice the renamed entry in place; the track list itself is unchanged.
+        idx = self.pagination_view._find_item(self.old_name)
+        if idx >= 0:
+            self.pagination_view.playlist_items[idx] = (
+                new_name, tracks if tracks is not None else self.pagination_view.playlist_items[idx][1]
+            )
         self.pagination_view.mode = "menu"
         self.pagination_view._rebuild_buttons()
         
         embed = self.pagination_view.build_embed()
-        await interaction.response.edit_message(embed=embed, view=self.pagination_view)
+        await interaction.edit_original_response(embed=embed, view=self.pagination_view)
 
 
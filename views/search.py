@@ -370,7 +370,7 @@ class SingleSongResultView(discord.ui.View):
             "added_at": time.time(),
         })
         
-        state.save_user_playlists_to_disk()
+        state.schedule_playlists_save()
         
         # Show success message and close
         await interaction.response.send_message(
@@ -449,7 +449,7 @@ class SingleSongPlaylistCreateModal(discord.ui.Modal, title="Create New Playlist
             "added_at": time.time(),
         })
         
-        state.save_user_playlists_to_disk()
+        state.schedule_playlists_save()
         
         await interaction.response.send_message(
             f"Added `{song_name}` to `{name}` playlist.",
@@ -888,7 +888,7 @@ class SearchPaginationView(discord.ui.View):
             "added_at": time.time(),
         })
         
-        state.save_user_playlists_to_disk()
+        state.schedule_playlists_save()
         
         # Return to song selected mode and update the search view
         self.mode = "song_selected"
@@ -10,8 +10,17 @@ from discord.ext import commands
 
 import helpers
 import state
-from constants import GENIUS_API_TOKEN
-from genius_client import GeniusClient
+
+
+# Preferred label keys for a snippet dict, in order.
+_SNIP_KEYS = ("label", "name", "id")
+
+
+def _snippet_label(snip: Any) -> Any:
+    """Return the display label for one snippet entry."""
+    if isinstance(snip, dict):
+        return next((v for k in _SNIP_KEYS if (v := snip.get(k))), snip)
+    return snip
 
 
 class LeakTimelineView(ui.View):
@@ -405,16 +414,13 @@ class LeakTimelineView(ui.View):
         lyrics = getattr(self.selected_song, "lyrics", None)
         
         # If no lyrics in API, try Genius as fallback
-        if not lyrics and GENIUS_API_TOKEN:
+        genius = helpers.get_genius()
+        if not lyrics and genius:
             await interaction.response.defer(ephemeral=True)
             
-            genius = GeniusClient(GENIUS_API_TOKEN)
-            try:
-                genius_lyrics = await genius.get_song_lyrics(name)
-                if genius_lyrics:
-                    lyrics = genius_lyrics
-            finally:
-                await genius.close()
+            genius_lyrics = await genius.get_song_lyrics(name)
+            if genius_lyrics:
+                lyrics = genius_lyrics
         
         if not lyrics:
             await interaction.response.send_message(
@@ -457,18 +463,10 @@ class LeakTimelineView(ui.View):
             return
         
         # Format snippets list
-        lines = []
         if isinstance(snippets, (list, tuple)):
-            for snip in snippets:
-                if isinstance(snip, dict):
-                    label = snip.get("label") or snip.get("name") or snip.get("id") or str(snip)
-                    lines.append(f"- {label}")
-                else:
-                    lines.append(f"- {snip}")
+            body = "\n".join(f"- {_snippet_label(snip)}" for snip in snippets)[:4096]
         else:
-            lines.append(str(snippets))
-        
-        body = "\n".join(lines)[:4096]
+            body = str(snippets)[:4096]
         
         embed = discord.Embed(
             title=f"🎬 Snippets - {name}",